@@ -9,6 +9,8 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from dotenv import load_dotenv
 from config import Config
+from app.cache import ResponseCache
+from app.pubsub import PubSub
 
 # Load environment variables
 load_dotenv()
@@ -17,6 +19,8 @@ load_dotenv()
 db = SQLAlchemy()
 jwt = JWTManager()
 migrate = Migrate()
+cache = ResponseCache()
+pubsub = PubSub()
 
 
 def configure_logging(app):
@@ -76,6 +80,8 @@ def create_app():
     db.init_app(app)
     jwt.init_app(app)
     migrate.init_app(app, db)
+    cache.init_app(app)
+    pubsub.init_app(app)
 
     # Enable CORS for API endpoints
     # TODO: Fix this for prod (adjust origins for production)
@@ -99,10 +105,14 @@ def create_app():
     from app.main.routes import main_bp  # pylint: disable=import-outside-toplevel
     from app.users.routes import users_bp  # pylint: disable=import-outside-toplevel
     from app.image.routes import image_bp  # pylint: disable=import-outside-toplevel
+    from app.tiles.routes import tiles_bp  # pylint: disable=import-outside-toplevel
+    from app.stats.routes import stats_bp  # pylint: disable=import-outside-toplevel
 
     app.register_blueprint(auth_bp, url_prefix="/api")
     app.register_blueprint(main_bp, url_prefix="/api")
     app.register_blueprint(users_bp, url_prefix="/api")
     app.register_blueprint(image_bp, url_prefix="/api")
+    app.register_blueprint(tiles_bp, url_prefix="/api")
+    app.register_blueprint(stats_bp, url_prefix="/api")
 
     return app
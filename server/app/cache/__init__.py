@@ -0,0 +1,34 @@
+"""Pluggable response cache extension"""
+
+from flask import current_app
+
+from app.cache.backends import MemoryBackend, RedisBackend
+
+
+class ResponseCache:
+    """Flask extension holding the configured cache backend"""
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        backend_name = app.config["CACHE_BACKEND"]
+
+        if backend_name == "memory":
+            backend = MemoryBackend(max_entries=app.config["CACHE_MAX_ENTRIES"])
+        elif backend_name == "redis":
+            import redis  # pylint: disable=import-outside-toplevel
+
+            backend = RedisBackend(redis.Redis.from_url(app.config["CACHE_REDIS_URL"]))
+        elif backend_name == "none":
+            backend = None
+        else:
+            raise ValueError(f"Unknown CACHE_BACKEND '{backend_name}'")
+
+        app.extensions["response_cache"] = backend
+
+    @property
+    def backend(self):
+        """The current app's cache backend, or None when caching is disabled"""
+        return current_app.extensions.get("response_cache")
@@ -0,0 +1,80 @@
+"""
+Response caching for sighting listings.
+
+Entries are keyed by the normalized listing query and the collection ETag.
+Every write bumps the collection version, so the next request on any worker
+builds a new key and the entries cached before the write are never served
+again; they simply age out after CACHE_TTL. Writes therefore flush all
+listings at once, with no per-entry invalidation to keep in sync.
+
+Bodies large enough to compress are also stored precompressed under
+``<key>|<encoding>``, so cache hits never recompress.
+"""
+
+import json
+
+from flask import current_app
+
+from app import cache
+from app.main.compression import compress_variants
+
+KEY_PREFIX = "sightings:"
+
+
+def listing_key(etag, user_id, bbox, limit, cursor):
+    """
+    Build the cache key for a normalized sightings listing query under the
+    collection ETag, so a write on any worker retires every cached listing
+    """
+    return KEY_PREFIX + json.dumps(
+        {
+            "etag": etag,
+            "user_id": user_id,
+            "bbox": list(bbox) if bbox else None,
+            "limit": limit,
+            "cursor": cursor,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+def _variant_key(key, encoding):
+    return f"{key}|{encoding}"
+
+
+def get_listing(key, encoding=None):
+    """
+    Return (body, content_encoding) for a cached listing, or None on a miss.
+    The variant compressed with encoding is preferred when one was stored.
+    """
+    backend = cache.backend
+    if backend is None:
+        return None
+
+    if encoding:
+        compressed = backend.get(_variant_key(key, encoding))
+        if compressed is not None:
+            return compressed, encoding
+
+    body = backend.get(key)
+    return (body, None) if body is not None else None
+
+
+def set_listing(key, body):
+    """
+    Cache a listing response body along with its compressed variants.
+    Returns the variants by encoding so the caller can respond without
+    compressing the body again.
+    """
+    backend = cache.backend
+    if backend is None:
+        return {}
+
+    ttl = current_app.config["CACHE_TTL"]
+    variants = compress_variants(body)
+    backend.set(key, body, ttl)
+    for encoding, compressed in variants.items():
+        backend.set(_variant_key(key, encoding), compressed, ttl)
+
+    return variants
@@ -0,0 +1,137 @@
+"""Size-bounded on-disk LRU cache for proxied images"""
+
+import fcntl
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from flask import current_app
+
+debug_logger = logging.getLogger("debug")
+
+TEMP_PREFIX = ".tmp-"
+LOCK_NAME = ".lock"
+# Temp files older than this were left behind by a crashed writer
+STALE_TEMP_SECONDS = 3600
+
+
+class DiskCache:
+    """
+    Read-through cache of image files in one directory, safe to share between
+    worker processes. Entries are written to a temp file and renamed into
+    place, so readers only ever see complete files. Access time tracks recency
+    (set explicitly, so noatime mounts do not matter) and the least recently
+    used files are evicted once the directory exceeds max_bytes.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, str(key))
+
+    def get(self, key):
+        """Path of a cached entry, marked as just used, or None on a miss"""
+        path = self.path(key)
+        try:
+            # Only the access time changes, so mtime-based validators stay stable
+            os.utime(path, (time.time(), os.stat(path).st_mtime))
+        except FileNotFoundError:
+            return None
+        return path
+
+    def fill(self, key, chunks):
+        """
+        Pass chunks through while writing them to the cache. The entry is only
+        committed if the whole stream was consumed; a client disconnecting
+        midway discards it.
+        """
+        fd, temp_path = tempfile.mkstemp(prefix=TEMP_PREFIX, dir=self.directory)
+        committed = False
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                for chunk in chunks:
+                    temp_file.write(chunk)
+                    yield chunk
+            os.replace(temp_path, self.path(key))
+            committed = True
+        finally:
+            if not committed:
+                try:
+                    os.unlink(temp_path)
+                except FileNotFoundError:
+                    pass
+
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits its budget"""
+        with open(os.path.join(self.directory, LOCK_NAME), "wb") as lock_file:
+            # One process evicts at a time; the others skip, it covers their writes
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return
+
+            entries = []
+            total = 0
+            now = time.time()
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if entry.name == LOCK_NAME:
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    if entry.name.startswith(TEMP_PREFIX):
+                        if now - stat.st_mtime > STALE_TEMP_SECONDS:
+                            self._unlink(entry.path)
+                        continue
+                    entries.append((stat.st_atime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                # Unlinking is safe while another process is still sending it
+                self._unlink(path)
+                total -= size
+
+    @staticmethod
+    def _unlink(path):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+_disk_cache = None
+_disk_cache_lock = threading.Lock()
+
+
+def get_disk_cache():
+    """The process-wide image disk cache, or None when IMAGE_DISK_CACHE_DIR is unset"""
+    global _disk_cache  # pylint: disable=global-statement
+
+    directory = current_app.config["IMAGE_DISK_CACHE_DIR"]
+    if not directory:
+        return None
+
+    max_bytes = current_app.config["IMAGE_DISK_CACHE_MAX_BYTES"]
+    disk_cache = _disk_cache
+    if (
+        disk_cache is not None
+        and disk_cache.directory == directory
+        and disk_cache.max_bytes == max_bytes
+    ):
+        return disk_cache
+
+    with _disk_cache_lock:
+        _disk_cache = DiskCache(directory, max_bytes)
+        return _disk_cache
@@ -1,13 +1,24 @@
 import os
-import boto3
+import hashlib
 import logging
 import uuid
 import io
-import json
 
-from flask import Blueprint, request, jsonify, current_app
+from botocore.exceptions import ClientError
+from flask import (
+    Blueprint,
+    Response,
+    request,
+    jsonify,
+    current_app,
+    redirect,
+    send_file,
+)
 from flask_jwt_extended import jwt_required
 
+from app.image.disk_cache import get_disk_cache
+from app.image.s3 import get_client, presigned_get_url
+from app.main.session import read_only
 from app.models.images import Image
 from app import db
 from PIL import Image as PILImage
@@ -16,53 +27,20 @@ image_bp = Blueprint("image_upload", __name__)
 debug_logger = logging.getLogger("debug")
 
 ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "gif"}
-
-def get_client():
-    is_prod = current_app.config['IS_PROD']
-    s3_region = current_app.config['S3_REGION']
-    s3_access_key = current_app.config['S3_ACCESS_KEY']
-    s3_secret_key = get_secret() if is_prod else os.getenv('S3_SECRET_KEY')
-
-    if not is_prod and not s3_secret_key:
-        debug_logger.error(f"Local S3 secret key not set properly in environment variable")
-        raise Exception('Local environment variables not set properly')
-
-    return boto3.client(
-        "s3",
-        aws_access_key_id=s3_access_key,
-        aws_secret_access_key=s3_secret_key,
-        region_name=s3_region,
-    )
-
-def get_secret():
-    secret_name = "honks3secret"
-    region_name = "us-east-1"
-
-    # Create a Secrets Manager client
-    session = boto3.session.Session()
-    client = session.client(
-        service_name='secretsmanager',
-        region_name=region_name
-    )
-
-    try:
-        get_secret_value_response = client.get_secret_value(
-            SecretId=secret_name
-        )
-    except ClientError as e:
-        # For a list of exceptions thrown, see
-        # https://docs.aws.amazon.com/secretsmanager/latest/apireference/API_GetSecretValue.html
-        raise e
-
-    secret = json.loads(get_secret_value_response['SecretString'])
-
-    return secret['honk-s3-secret']
+MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'gif': 'image/gif'
+}
+# Extensions for the image formats Pillow detects in direct uploads
+FORMAT_EXTENSIONS = {"PNG": "png", "JPEG": "jpg", "GIF": "gif"}
 
 def allowed_file(filename):
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
 def is_file_size_valid(file_stream):
-    MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
     file_stream.seek(0, os.SEEK_END)
     file_size = file_stream.tell()
     file_stream.seek(0)
@@ -132,10 +110,11 @@ def upload_image():
         if sanitized_image is None:
             return jsonify({"error": "Could not process image"}), 400
 
+        content_hash = hashlib.sha256(sanitized_image.getbuffer()).hexdigest()
         s3_client.upload_fileobj(sanitized_image, s3_bucket_name, s3_path, ExtraArgs={"ACL": "public-read", "ContentType": file.content_type})
 
         image_url = f"https://{s3_bucket_name}.s3.amazonaws.com/{s3_path}"
-        image = Image(id=image_id, s3_url=image_url)
+        image = Image(id=image_id, s3_url=image_url, content_hash=content_hash)
         db.session.add(image)
         db.session.commit()
 
@@ -146,6 +125,106 @@ def upload_image():
         debug_logger.error(f"Error uploading image: {e}")
         return jsonify({"error": "An unexpected error occurred"}), 500
 
+def staging_path(image_id):
+    """S3 key that a presigned upload is written to before it is finalized"""
+    return f"uploads/{image_id}"
+
+
+@image_bp.route("/image-upload/presign", methods=["POST"])
+@jwt_required()
+def presign_image_upload():
+    """
+    POST /api/image-upload/presign
+    Returns a presigned POST that lets the client upload an image straight to
+    S3. The upload only becomes an image once it is finalized.
+    """
+    try:
+        s3_client = get_client()
+        s3_bucket_name = current_app.config['S3_BUCKET_NAME']
+
+        image_id = uuid.uuid4()
+        presigned_post = s3_client.generate_presigned_post(
+            s3_bucket_name,
+            staging_path(image_id),
+            Conditions=[["content-length-range", 1, MAX_FILE_SIZE]],
+            ExpiresIn=current_app.config["IMAGE_PRESIGNED_POST_TTL"],
+        )
+
+        return jsonify(
+            {
+                "id": image_id,
+                "url": presigned_post["url"],
+                "fields": presigned_post["fields"],
+            }
+        ), 201
+
+    except Exception as e:
+        debug_logger.error(f"Error presigning image upload: {e}")
+        return jsonify({"error": "An unexpected error occurred"}), 500
+
+
+@image_bp.route("/image-upload/<image_id>/finalize", methods=["POST"])
+@jwt_required()
+def finalize_image_upload(image_id):
+    """
+    POST /api/image-upload/<image_id>/finalize
+    Sanitizes an image uploaded through a presigned POST, stores it under
+    images/ like /api/image-upload does and returns its id
+    """
+    try:
+        uuid_obj = uuid.UUID(image_id)
+    except ValueError:
+        return jsonify({"error": "Upload not found"}), 404
+
+    try:
+        if db.session.get(Image, uuid_obj):
+            return jsonify({"error": "Upload already finalized"}), 409
+
+        s3_client = get_client()
+        s3_bucket_name = current_app.config['S3_BUCKET_NAME']
+        upload_path = staging_path(uuid_obj)
+
+        try:
+            upload = s3_client.get_object(Bucket=s3_bucket_name, Key=upload_path)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "NoSuchKey":
+                return jsonify({"error": "Upload not found"}), 404
+            raise
+
+        if upload["ContentLength"] > MAX_FILE_SIZE:
+            s3_client.delete_object(Bucket=s3_bucket_name, Key=upload_path)
+            return jsonify({"error": "File too big, max size 5MB"}), 400
+
+        file = io.BytesIO(upload["Body"].read())
+        try:
+            ext = FORMAT_EXTENSIONS.get(PILImage.open(file).format)
+        except Exception:
+            ext = None
+        file.seek(0)
+
+        s3_filename = f'{str(uuid_obj)}.{ext}'
+        sanitized_image = sanitize_image(file, s3_filename) if ext else None
+        if sanitized_image is None:
+            s3_client.delete_object(Bucket=s3_bucket_name, Key=upload_path)
+            return jsonify({"error": "Could not process image"}), 400
+
+        s3_path = f"images/{s3_filename}"
+        content_hash = hashlib.sha256(sanitized_image.getbuffer()).hexdigest()
+        s3_client.upload_fileobj(sanitized_image, s3_bucket_name, s3_path, ExtraArgs={"ACL": "public-read", "ContentType": CONTENT_TYPES[ext]})
+        s3_client.delete_object(Bucket=s3_bucket_name, Key=upload_path)
+
+        image_url = f"https://{s3_bucket_name}.s3.amazonaws.com/{s3_path}"
+        image = Image(id=uuid_obj, s3_url=image_url, content_hash=content_hash)
+        db.session.add(image)
+        db.session.commit()
+
+        return jsonify({"id": uuid_obj}), 201
+
+    except Exception as e:
+        db.session.rollback()  # does nothing if no transaction occured
+        debug_logger.error(f"Error finalizing image upload: {e}")
+        return jsonify({"error": "An unexpected error occurred"}), 500
+
 @image_bp.route("/image-delete/<image_id>", methods=["DELETE"])
 @jwt_required()
 def delete_image(image_id):
@@ -177,43 +256,131 @@ def delete_image(image_id):
         debug_logger.error(f"Error deleting image: {e}")
         return jsonify({"error": "An unexpected error occurred"}), 500
 
+def stream_body(body, chunk_size):
+    """Relay an S3 object body in fixed-size chunks, closing it when done"""
+    try:
+        yield from body.iter_chunks(chunk_size)
+    finally:
+        body.close()
+
+
+def set_immutable(response, etag=None):
+    """Let browsers and CDNs keep an image forever; image keys are never reused"""
+    if etag:
+        response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config["IMAGE_CACHE_MAX_AGE"]
+    response.cache_control.immutable = True
+    return response
+
+
 @image_bp.route("/image/<image_id>", methods=["GET"])
+@read_only
 def get_image(image_id):
     """
     GET /api/image/<image_id>
-    Retrieves the actual image file from S3 based on image ID
+    Streams the actual image file from S3 based on image ID, honoring a
+    single-range Range header with a 206 partial response. Images are served
+    from the local disk cache when IMAGE_DISK_CACHE_DIR is set.
+    With IMAGE_DELIVERY_MODE=redirect, redirects to a presigned S3 URL instead.
+    Images never change, so they are sent as immutable with a strong ETag and
+    If-None-Match is answered from the stored content hash without S3.
     """
     try:
-        s3_client = get_client()
-        s3_bucket_name = current_app.config['S3_BUCKET_NAME']
+        uuid_obj = uuid.UUID(image_id)
+    except ValueError:
+        return jsonify({"error": "Image not found"}), 404
 
-        if not image_id:
-            return jsonify({"error": "Image id is required"}), 400
-
-        image = Image.query.filter_by(id=image_id).first()
+    try:
+        image = db.session.get(Image, uuid_obj)
         if not image:
             return jsonify({"error": "Image not found"}), 404
 
+        s3_bucket_name = current_app.config['S3_BUCKET_NAME']
+
         s3_path = image.s3_url.split(f"https://{s3_bucket_name}.s3.amazonaws.com/")[-1]
+        filename = s3_path.split('/')[-1]
+
+        if current_app.config["IMAGE_DELIVERY_MODE"] == "redirect":
+            url, max_age = presigned_get_url(s3_path)
+            response = redirect(url, 302)
+            response.cache_control.private = True
+            response.cache_control.max_age = max_age
+            return response
 
         # Get the file extension to determine content type
         file_extension = s3_path.split('.')[-1].lower()
-        content_types = {
-            'png': 'image/png',
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg',
-            'gif': 'image/gif'
-        }
-        content_type = content_types.get(file_extension, 'application/octet-stream')
+        content_type = CONTENT_TYPES.get(file_extension, 'application/octet-stream')
+
+        if image.content_hash and request.if_none_match.contains(image.content_hash):
+            return set_immutable(Response(status=304), image.content_hash)
+
+        disk_cache = get_disk_cache()
+        if disk_cache is not None:
+            cached_path = disk_cache.get(image.id)
+            if cached_path:
+                try:
+                    # send_file handles Range itself and uses sendfile where the server can
+                    response = send_file(
+                        cached_path,
+                        mimetype=content_type,
+                        download_name=filename,
+                        conditional=True,
+                        etag=image.content_hash or True,
+                    )
+                    return set_immutable(response)
+                except FileNotFoundError:
+                    pass  # evicted since the lookup, fetch it from S3 again
 
-        file_obj = s3_client.get_object(Bucket=s3_bucket_name, Key=s3_path)
-        file_data = file_obj['Body'].read()
-
-        from flask import send_file, Response
-        return Response(
-            file_data,
+        s3_client = get_client()
+        get_args = {"Bucket": s3_bucket_name, "Key": s3_path}
+        # Single byte ranges are forwarded to S3; multiple ranges get the whole file
+        byte_range = request.range
+        if byte_range and byte_range.units == "bytes" and len(byte_range.ranges) == 1:
+            get_args["Range"] = byte_range.to_header()
+        # Older uploads have no content hash, so S3 checks their object ETag
+        if not image.content_hash and request.if_none_match:
+            get_args["IfNoneMatch"] = request.headers["If-None-Match"]
+
+        try:
+            file_obj = s3_client.get_object(**get_args)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code")
+            if error_code == "InvalidRange":
+                return jsonify({"error": "Requested range not satisfiable"}), 416
+            if error_code == "304":
+                return set_immutable(Response(status=304))
+            raise
+
+        headers = {
+            "Content-Disposition": f"inline; filename={filename}",
+            "Content-Length": str(file_obj["ContentLength"]),
+            "Accept-Ranges": "bytes",
+        }
+        status = 200
+        if file_obj.get("ContentRange"):
+            headers["Content-Range"] = file_obj["ContentRange"]
+            status = 206
+
+        body = stream_body(file_obj["Body"], current_app.config["IMAGE_STREAM_CHUNK_SIZE"])
+        # Cache whole objects only, and never one that would not fit the budget
+        if (
+            disk_cache is not None
+            and status == 200
+            and file_obj["ContentLength"] <= disk_cache.max_bytes
+        ):
+            body = disk_cache.fill(image.id, body)
+
+        response = Response(
+            body,
+            status=status,
             mimetype=content_type,
-            headers={"Content-Disposition": f"inline; filename={s3_path.split('/')[-1]}"}
+            headers=headers,
+            direct_passthrough=True,
+        )
+        response.last_modified = file_obj.get("LastModified")
+        return set_immutable(
+            response, image.content_hash or file_obj.get("ETag", "").strip('"')
         )
 
     except Exception as e:
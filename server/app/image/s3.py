@@ -0,0 +1,176 @@
+"""Process-wide S3 client and cached Secrets Manager credentials"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+import boto3
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import ClientError
+from flask import current_app
+
+from app import cache
+
+debug_logger = logging.getLogger("debug")
+
+SECRET_NAME = "honks3secret"
+SECRET_REGION = "us-east-1"
+
+
+class SecretCache:
+    """
+    Cache a secret for ttl seconds, refreshing it refresh_margin seconds before
+    it expires. While one thread refreshes, the others keep using the cached
+    value, and a failed refresh keeps serving it until it actually expires.
+    """
+
+    def __init__(self, fetch, ttl, refresh_margin, clock=time.monotonic):
+        self._fetch = fetch
+        self.ttl = ttl
+        self.refresh_margin = refresh_margin
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._value = None
+        self._refresh_at = 0.0
+        self._expires_at = 0.0
+
+    def get(self):
+        now = self._clock()
+        if self._value is not None and now < self._refresh_at:
+            return self._value
+
+        if self._value is not None and now < self._expires_at:
+            # Refresh window: only one thread fetches, the rest use the old value
+            if not self._lock.acquire(blocking=False):
+                return self._value
+        else:
+            self._lock.acquire()
+
+        try:
+            now = self._clock()
+            if self._value is not None and now < self._refresh_at:
+                return self._value
+
+            try:
+                value = self._fetch()
+            except Exception:
+                if self._value is not None and now < self._expires_at:
+                    debug_logger.error("Secret refresh failed, using cached secret", exc_info=True)
+                    return self._value
+                raise
+
+            self._value = value
+            self._refresh_at = now + self.ttl - self.refresh_margin
+            self._expires_at = now + self.ttl
+            return value
+        finally:
+            self._lock.release()
+
+
+def fetch_secret():
+    """Fetch the S3 secret key from Secrets Manager"""
+    client = boto3.session.Session().client(
+        service_name="secretsmanager", region_name=SECRET_REGION
+    )
+
+    try:
+        get_secret_value_response = client.get_secret_value(SecretId=SECRET_NAME)
+    except ClientError as e:
+        # For a list of exceptions thrown, see
+        # https://docs.aws.amazon.com/secretsmanager/latest/apireference/API_GetSecretValue.html
+        raise e
+
+    secret = json.loads(get_secret_value_response["SecretString"])
+
+    return secret["honk-s3-secret"]
+
+
+_secret_cache = None
+# (pid, secret key, client), swapped as one tuple so readers never need the lock
+_client_entry = None
+_client_lock = threading.Lock()
+
+
+def get_secret():
+    """The S3 secret key, fetched from Secrets Manager at most once per TTL"""
+    global _secret_cache  # pylint: disable=global-statement
+
+    if _secret_cache is None:
+        with _client_lock:
+            if _secret_cache is None:
+                _secret_cache = SecretCache(
+                    fetch_secret,
+                    ttl=current_app.config["S3_SECRET_TTL"],
+                    refresh_margin=current_app.config["S3_SECRET_REFRESH_MARGIN"],
+                )
+    return _secret_cache.get()
+
+
+def get_client():
+    """
+    The process-wide S3 client. boto3 clients are thread-safe, so one client
+    and its connection pool are shared by every request in the process. It is
+    rebuilt after a fork or when the secret key rotates.
+    """
+    global _client_entry  # pylint: disable=global-statement
+
+    is_prod = current_app.config["IS_PROD"]
+    s3_secret_key = get_secret() if is_prod else os.getenv("S3_SECRET_KEY")
+
+    if not is_prod and not s3_secret_key:
+        debug_logger.error("Local S3 secret key not set properly in environment variable")
+        raise Exception("Local environment variables not set properly")
+
+    key = (os.getpid(), s3_secret_key)
+    entry = _client_entry
+    if entry is not None and entry[:2] == key:
+        return entry[2]
+
+    with _client_lock:
+        entry = _client_entry
+        if entry is None or entry[:2] != key:
+            # Sessions are not thread-safe, so each client gets its own
+            client = boto3.session.Session().client(
+                "s3",
+                aws_access_key_id=current_app.config["S3_ACCESS_KEY"],
+                aws_secret_access_key=s3_secret_key,
+                region_name=current_app.config["S3_REGION"],
+                config=BotoConfig(
+                    max_pool_connections=current_app.config["S3_MAX_POOL_CONNECTIONS"],
+                    tcp_keepalive=True,
+                ),
+            )
+            entry = _client_entry = (*key, client)
+        return entry[2]
+
+
+def presigned_get_url(s3_path):
+    """
+    Presigned GET URL for an object, shared through the response cache until
+    IMAGE_PRESIGNED_URL_REFRESH_MARGIN seconds before it expires.
+    Returns (url, seconds the URL can still be handed out for).
+    """
+    ttl = current_app.config["IMAGE_PRESIGNED_URL_TTL"]
+    margin = current_app.config["IMAGE_PRESIGNED_URL_REFRESH_MARGIN"]
+    backend = cache.backend
+    key = f"image-url:{s3_path}"
+    now = time.time()
+
+    if backend is not None:
+        cached = backend.get(key)
+        if cached is not None:
+            if isinstance(cached, bytes):
+                cached = cached.decode()
+            expires_at, url = cached.split(" ", 1)
+            return url, max(0, int(float(expires_at) - margin - now))
+
+    url = get_client().generate_presigned_url(
+        "get_object",
+        Params={"Bucket": current_app.config["S3_BUCKET_NAME"], "Key": s3_path},
+        ExpiresIn=ttl,
+    )
+    if backend is not None:
+        backend.set(key, f"{now + ttl} {url}", ttl - margin)
+    return url, ttl - margin
@@ -0,0 +1,90 @@
+"""Accept-Encoding negotiation and compression for large response bodies"""
+
+import gzip
+import zlib
+
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the deployment
+    brotli = None
+
+# Preferred first when the client accepts both with the same quality
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding():
+    """Pick the best supported encoding from the request's Accept-Encoding, or None"""
+    return request.accept_encodings.best_match(ENCODINGS)
+
+
+def should_compress(body):
+    """Small bodies are sent as-is, since compressing them saves next to nothing"""
+    return len(body) >= current_app.config["COMPRESSION_MIN_SIZE"]
+
+
+def compress(body, encoding):
+    """Compress a complete response body with the given content coding"""
+    if encoding == "br":
+        return brotli.compress(
+            body, quality=current_app.config["COMPRESSION_BROTLI_QUALITY"]
+        )
+    # mtime=0 keeps the output identical for identical bodies
+    return gzip.compress(
+        body, compresslevel=current_app.config["COMPRESSION_GZIP_LEVEL"], mtime=0
+    )
+
+
+def compress_variants(body):
+    """Compress a body with every supported encoding, or none if it is too small"""
+    if not should_compress(body):
+        return {}
+    return {encoding: compress(body, encoding) for encoding in ENCODINGS}
+
+
+def compress_stream(chunks, encoding):
+    """
+    Compress a streamed body chunk by chunk. Each chunk is flushed so clients
+    can start decoding before the stream ends.
+    """
+    if encoding == "br":
+        compressor = brotli.Compressor(
+            quality=current_app.config["COMPRESSION_BROTLI_QUALITY"]
+        )
+        for chunk in chunks:
+            yield compressor.process(chunk) + compressor.flush()
+        yield compressor.finish()
+        return
+
+    # wbits=31 writes a gzip header and trailer around the deflate stream
+    compressor = zlib.compressobj(
+        current_app.config["COMPRESSION_GZIP_LEVEL"], zlib.DEFLATED, 31
+    )
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def set_content_encoding(response, encoding):
+    """Mark a response as encoded, and as varying by Accept-Encoding either way"""
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def encoded_response(body, encoding, compressed=None, mimetype="application/json"):
+    """
+    Build a response for an uncompressed body, compressing it for the negotiated
+    encoding unless it is below the size threshold. A precompressed variant can
+    be passed in to skip compressing it again.
+    """
+    if encoding and should_compress(body):
+        if compressed is None:
+            compressed = compress(body, encoding)
+        response = current_app.response_class(compressed, mimetype=mimetype)
+        return set_content_encoding(response, encoding)
+
+    response = current_app.response_class(body, mimetype=mimetype)
+    return set_content_encoding(response, None)
@@ -0,0 +1,79 @@
+"""Conditional GET helpers for versioned collections"""
+
+import datetime
+
+from flask import current_app, request
+
+from app import cache
+from app.models.collection_version import CollectionVersion
+
+VERSION_KEY_PREFIX = "version:"
+
+
+def _current_version(name):
+    """
+    Return a collection's (version, updated_at), read through the response
+    cache for up to CACHE_VERSION_TTL seconds so cache hits skip the database.
+    Writers drop the cached version after committing, so workers sharing the
+    backend see a write immediately. Workers with their own memory backend, or
+    a read racing the write, see it once the TTL runs out.
+    """
+    backend = cache.backend
+    key = VERSION_KEY_PREFIX + name
+
+    cached = backend.get(key) if backend is not None else None
+    if cached is not None:
+        if isinstance(cached, bytes):
+            cached = cached.decode()
+        version, updated_at = cached.split(" ", 1)
+        return int(version), (
+            datetime.datetime.fromisoformat(updated_at) if updated_at else None
+        )
+
+    version, updated_at = CollectionVersion.current(name)
+    if backend is not None:
+        backend.set(
+            key,
+            f"{version} {updated_at.isoformat() if updated_at else ''}",
+            current_app.config["CACHE_VERSION_TTL"],
+        )
+    return version, updated_at
+
+
+def forget_collection_version(name):
+    """Drop a collection's cached version after committing a write to it"""
+    backend = cache.backend
+    if backend is not None:
+        backend.delete(VERSION_KEY_PREFIX + name)
+
+
+def collection_validators(name):
+    """Return the (etag, last_modified) validators for a collection's current version"""
+    version, updated_at = _current_version(name)
+    return f"{name}-{version}", updated_at
+
+
+def is_not_modified(etag, last_modified):
+    """Check the request's If-None-Match / If-Modified-Since against the validators"""
+    if request.if_none_match:
+        # If-None-Match uses weak comparison, so W/ and strong tags both match
+        return request.if_none_match.contains_weak(etag)
+
+    if request.if_modified_since and last_modified:
+        # HTTP dates have one-second resolution
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+
+    return False
+
+
+def set_validators(response, etag, last_modified):
+    """
+    Attach validators so clients revalidate instead of refetching. The ETag is
+    weak because the same version is sent in several content codings, and a
+    strong validator must differ between them.
+    """
+    response.set_etag(etag, weak=True)
+    if last_modified:
+        response.last_modified = last_modified
+    response.cache_control.no_cache = True
+    return response
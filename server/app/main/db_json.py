@@ -0,0 +1,102 @@
+"""
+Database-side JSON assembly for sighting listings.
+
+On Postgres the listing body can be built by json_build_object / json_agg, so
+the worker relays a single text value instead of decoding and re-encoding
+every row. Other databases fall back to the Python serialization path.
+"""
+
+import uuid
+
+from sqlalchemy import Text, cast, func, literal_column, null, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from app.main.pagination import after_cursor, encode_cursor
+from app.main.serializers import dumps
+from app.models.sightings import Sighting
+from app import db
+
+
+def db_json_supported():
+    """Whether the database can assemble listing JSON itself"""
+    return db.engine.dialect.name == "postgresql"
+
+
+def _json_object(**fields):
+    """json_build_object with its keys inlined as constants rather than bound"""
+    args = []
+    for key, value in fields.items():
+        args += [literal_column(f"'{key}'"), value]
+    return func.json_build_object(*args)
+
+
+def _sighting_object(page):
+    """JSON object for one listing row, in the same layout as Sighting.to_dict"""
+    return _json_object(
+        id=page.c.id,
+        name=page.c.name,
+        notes=page.c.notes,
+        image=page.c.image,
+        created_date=page.c.created_date,
+        updated_at=page.c.updated_at,
+        coords=_json_object(lat=page.c.latitude, lng=page.c.longitude),
+        user=_json_object(
+            id=page.c.user_id,
+            username=page.c.username,
+            description=page.c.description,
+            profile_picture=page.c.profile_picture,
+            is_banned=page.c.is_banned,
+        ),
+    )
+
+
+def db_json_listing(query, limit=None, cursor=None):
+    """
+    Build the listing body for a sighting rows query in one statement.
+    Pagination matches paginate(): limit + 1 rows are ranked newest-first and
+    the extra row only decides whether a next_cursor is returned.
+    """
+    if cursor:
+        query = after_cursor(query, cursor)
+
+    order = (Sighting.created_date.desc(), Sighting.id.desc())
+    page = query.add_columns(
+        func.row_number().over(order_by=order).label("position")
+    ).order_by(*order)
+    if limit is not None:
+        page = page.limit(limit + 1)
+    page = page.subquery()
+
+    in_page = page.c.position <= limit if limit is not None else true()
+    at_last = page.c.position == limit if limit is not None else null()
+
+    statement = select(
+        cast(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(_sighting_object(page), page.c.position)
+                ).filter(in_page),
+                literal_column("'[]'::json"),
+            ),
+            Text,
+        ),
+        func.count(),
+        func.max(page.c.created_date).filter(at_last),
+        func.max(cast(page.c.id, Text)).filter(at_last),
+    )
+    sightings_json, fetched, last_created, last_id = db.session.execute(
+        statement
+    ).one()
+
+    next_cursor = None
+    if limit is not None and fetched > limit:
+        next_cursor = encode_cursor(last_created, uuid.UUID(last_id))
+
+    body = (
+        b'{"sightings":'
+        + sightings_json.encode()
+        + b',"next_cursor":'
+        + dumps(next_cursor)
+        + b"}"
+    )
+    return body
@@ -0,0 +1,85 @@
+"""Streaming bulk export of sightings"""
+
+import csv
+import io
+
+from app.main.serializers import dumps, serialize_sighting_row, sighting_rows_query
+from app.models.sightings import Sighting
+
+CSV_COLUMNS = (
+    "id",
+    "name",
+    "notes",
+    "image",
+    "created_date",
+    "updated_at",
+    "lat",
+    "lng",
+    "user_id",
+    "username",
+    "description",
+    "profile_picture",
+    "is_banned",
+)
+
+
+def _export_rows(batch_size):
+    """Iterate every sighting row through a server-side cursor, batch_size at a time"""
+    return (
+        sighting_rows_query()
+        .order_by(Sighting.created_date, Sighting.id)
+        .yield_per(batch_size)
+    )
+
+
+def _batched(lines, batch_size):
+    """Join lines into one chunk per batch so each write carries many rows"""
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= batch_size:
+            yield b"".join(chunk)
+            chunk = []
+    if chunk:
+        yield b"".join(chunk)
+
+
+def ndjson_export(batch_size):
+    """Yield the sightings as newline-delimited JSON in the to_dict layout"""
+    lines = (
+        dumps(serialize_sighting_row(row)) + b"\n" for row in _export_rows(batch_size)
+    )
+    return _batched(lines, batch_size)
+
+
+def _csv_line(values):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue().encode()
+
+
+def csv_export(batch_size):
+    """Yield the sightings as CSV, flattening the coords and user objects"""
+    yield _csv_line(CSV_COLUMNS)
+
+    lines = (
+        _csv_line(
+            (
+                row.id,
+                row.name,
+                row.notes,
+                row.image,
+                row.created_date.isoformat() if row.created_date else None,
+                row.updated_at.isoformat() if row.updated_at else None,
+                row.latitude,
+                row.longitude,
+                row.user_id,
+                row.username,
+                row.description,
+                row.profile_picture,
+                row.is_banned,
+            )
+        )
+        for row in _export_rows(batch_size)
+    )
+    yield from _batched(lines, batch_size)
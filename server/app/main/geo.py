@@ -0,0 +1,152 @@
+"""Geographic query helpers for sighting listings"""
+
+import heapq
+import math
+from collections import namedtuple
+
+from sqlalchemy import Integer, func, or_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+from app.models.sightings import Sighting
+from app import db
+
+BoundingBox = namedtuple("BoundingBox", ["min_lat", "min_lng", "max_lat", "max_lng"])
+
+EARTH_RADIUS_M = 6_371_008.8
+
+
+def parse_bbox(raw_bbox):
+    """
+    Parse a ?bbox=minLat,minLng,maxLat,maxLng query parameter.
+    A min_lng greater than max_lng describes a box that crosses the antimeridian.
+    """
+    parts = raw_bbox.split(",")
+    if len(parts) != 4:
+        raise ValueError("Bounding box must be 'minLat,minLng,maxLat,maxLng'")
+
+    bbox = BoundingBox(*(float(part) for part in parts))
+
+    if not (-90 <= bbox.min_lat <= bbox.max_lat <= 90):
+        raise ValueError("Bounding box latitudes must be ordered and within -90 and 90")
+    if not (-180 <= bbox.min_lng <= 180 and -180 <= bbox.max_lng <= 180):
+        raise ValueError("Bounding box longitudes must be between -180 and 180")
+
+    return bbox
+
+
+def filter_bbox(query, bbox):
+    """Restrict a sightings query to rows inside the bounding box"""
+    query = query.filter(Sighting.latitude.between(bbox.min_lat, bbox.max_lat))
+
+    if bbox.min_lng <= bbox.max_lng:
+        return query.filter(Sighting.longitude.between(bbox.min_lng, bbox.max_lng))
+
+    return query.filter(
+        or_(Sighting.longitude >= bbox.min_lng, Sighting.longitude <= bbox.max_lng)
+    )
+
+
+def bbox_contains(bbox, lat, lng):
+    """Check whether a coordinate falls inside the bounding box"""
+    if not bbox.min_lat <= lat <= bbox.max_lat:
+        return False
+    if bbox.min_lng <= bbox.max_lng:
+        return bbox.min_lng <= lng <= bbox.max_lng
+    return lng >= bbox.min_lng or lng <= bbox.max_lng
+
+
+def haversine_m(lat1, lng1, lat2, lng2):
+    """Great-circle distance in metres between two coordinates"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def radius_bbox(lat, lng, radius_m):
+    """Smallest bounding box containing every point within radius_m of a coordinate"""
+    d_lat = math.degrees(radius_m / EARTH_RADIUS_M)
+    min_lat, max_lat = lat - d_lat, lat + d_lat
+
+    if min_lat <= -90 or max_lat >= 90:
+        # The circle covers a pole, so it spans every longitude
+        return BoundingBox(max(min_lat, -90), -180, min(max_lat, 90), 180)
+
+    d_lng = math.degrees(
+        math.asin(min(1.0, math.sin(radius_m / EARTH_RADIUS_M) / math.cos(math.radians(lat))))
+    )
+    if d_lng >= 180:
+        return BoundingBox(min_lat, -180, max_lat, 180)
+
+    # Wrap across the antimeridian, which filter_bbox handles as min_lng > max_lng
+    min_lng = (lng - d_lng + 180) % 360 - 180
+    max_lng = (lng + d_lng + 180) % 360 - 180
+    return BoundingBox(min_lat, min_lng, max_lat, max_lng)
+
+
+def nearest_sightings(query, lat, lng, k, radius_m):
+    """
+    Return [(row, distance_m)] for the k rows of a sightings query closest to a
+    coordinate within radius_m. The indexed bbox prefilter selects the
+    candidates in the same query, which are then ranked by exact haversine distance.
+    """
+    candidates = filter_bbox(query, radius_bbox(lat, lng, radius_m))
+
+    distances = []
+    for row in candidates:
+        distance = haversine_m(lat, lng, row.latitude, row.longitude)
+        if distance <= radius_m:
+            distances.append((row, distance))
+
+    return heapq.nsmallest(k, distances, key=lambda item: item[1])
+
+
+class grid_floor(FunctionElement):
+    """floor() of a non-negative expression, portable across Postgres and SQLite"""
+
+    type = Integer()
+    inherit_cache = True
+
+
+@compiles(grid_floor)
+def _compile_grid_floor(element, compiler, **kw):
+    return f"floor({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(grid_floor, "sqlite")
+def _compile_grid_floor_sqlite(element, compiler, **kw):
+    # SQLite has no floor() without the math extension; truncation is
+    # equivalent because cluster cell coordinates are shifted to be non-negative
+    return f"CAST({compiler.process(element.clauses, **kw)} AS INTEGER)"
+
+
+def cluster_cell_size(zoom, cells_per_tile):
+    """Width in degrees of a cluster cell at the given slippy-map zoom level"""
+    return 360.0 / (2**zoom) / cells_per_tile
+
+
+def cluster_sightings(bbox, zoom, cells_per_tile):
+    """
+    Group sightings into a square degree grid sized for the zoom level.
+    Returns one centroid and count per non-empty cell, computed by the database.
+    """
+    cell_size = cluster_cell_size(zoom, cells_per_tile)
+    cell_lat = grid_floor((Sighting.latitude + 90) / cell_size)
+    cell_lng = grid_floor((Sighting.longitude + 180) / cell_size)
+
+    query = db.session.query(
+        func.avg(Sighting.latitude),
+        func.avg(Sighting.longitude),
+        func.count(Sighting.id),
+    )
+    if bbox:
+        query = filter_bbox(query, bbox)
+
+    rows = query.group_by(cell_lat, cell_lng).all()
+
+    return [{"lat": lat, "lng": lng, "count": count} for lat, lng, count in rows]
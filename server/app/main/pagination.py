@@ -0,0 +1,91 @@
+"""Keyset (cursor) pagination helpers for sighting listings"""
+
+import base64
+import datetime
+import json
+import uuid
+
+from sqlalchemy import and_, or_
+
+from app.models.sightings import Sighting
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client supplies a malformed pagination cursor"""
+
+
+def encode_token(values):
+    """Encode a list of JSON-serializable sort key values into an opaque token"""
+    payload = json.dumps(values)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_token(token):
+    """Decode an opaque token back into its list of sort key values"""
+    padded = token + "=" * (-len(token) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def encode_cursor(created_date, sighting_id):
+    """Encode the (created_date, id) sort key of a row into an opaque cursor"""
+    return encode_token([created_date.isoformat(), str(sighting_id)])
+
+
+def decode_cursor(cursor):
+    """Decode an opaque cursor back into its (created_date, id) sort key"""
+    try:
+        created_str, id_str = decode_token(cursor)
+        return datetime.datetime.fromisoformat(created_str), uuid.UUID(id_str)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursor("Invalid cursor") from e
+
+
+def parse_limit(raw_limit, default, maximum):
+    """Parse the ?limit= query parameter, clamping it to the configured maximum"""
+    if raw_limit is None:
+        return default
+
+    limit = int(raw_limit)
+    if limit < 1:
+        raise ValueError("Limit must be a positive integer")
+    return min(limit, maximum)
+
+
+def after_cursor(query, cursor):
+    """Restrict a sightings query to the rows that sort after a cursor, newest-first"""
+    created_date, sighting_id = decode_cursor(cursor)
+    return query.filter(
+        or_(
+            Sighting.created_date < created_date,
+            and_(
+                Sighting.created_date == created_date,
+                Sighting.id < sighting_id,
+            ),
+        )
+    )
+
+
+def paginate(query, limit, cursor=None):
+    """
+    Apply newest-first keyset pagination to a sightings query.
+    Rows are ordered by (created_date, id) descending and the cursor is
+    compared against that key directly, so no OFFSET is ever issued.
+    Returns (rows, next_cursor), where next_cursor is None on the last page.
+    """
+    if cursor:
+        query = after_cursor(query, cursor)
+
+    # Fetch one extra row to find out whether another page exists
+    rows = (
+        query.order_by(Sighting.created_date.desc(), Sighting.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_date, last.id)
+
+    return rows, next_cursor
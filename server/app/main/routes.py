@@ -1,14 +1,53 @@
 """Main application routes"""
 
 import logging
+import datetime
 import bleach
 
-from flask import Blueprint, request, jsonify, make_response
+from flask import (
+    Blueprint,
+    request,
+    jsonify,
+    make_response,
+    current_app,
+    stream_with_context,
+)
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import func, insert, select
 
-from app.models.sightings import Sighting
+from app.models.sightings import Sighting, SightingTombstone
 from app.models.user import User
-from app import db
+from app.models.activity import SightingActivityRollup
+from app.models.collection_version import CollectionVersion, SIGHTINGS_COLLECTION
+from app.cache.sightings import get_listing, listing_key, set_listing
+from app.main.compression import (
+    compress_stream,
+    encoded_response,
+    negotiate_encoding,
+    set_content_encoding,
+)
+from app.main.conditional import (
+    collection_validators,
+    forget_collection_version,
+    is_not_modified,
+    set_validators,
+)
+from app.main.db_json import db_json_listing, db_json_supported
+from app.main.export import csv_export, ndjson_export
+from app.main.heatmap import heatmap_grid
+from app.main.geo import cluster_sightings, filter_bbox, nearest_sightings, parse_bbox
+from app.main.pagination import InvalidCursor, paginate, parse_limit
+from app.main.search import search_sightings
+from app.main.stream import publish_sighting, sighting_events
+from app.main.sync import parse_since, sync_changes
+from app.main.session import commit_without_expiry, read_only
+from app.main.serializers import (
+    dumps,
+    json_response,
+    serialize_sighting_row,
+    sighting_rows_query,
+)
+from app import db, pubsub
 import uuid
 
 main_bp = Blueprint("main", __name__)
@@ -49,16 +88,24 @@ def submit_sighting():
         coords = bleach.clean(data.get("coords"))
         image = bleach.clean(data.get("image"))
 
+        now = datetime.datetime.utcnow()
         goose_sighting = Sighting(
             name=name,
             notes=notes,
             coords=coords,
             image=image,
             user_id=current_user,
-            user=user,
+            created_date=now,
+            updated_at=now,
         )
+        SightingActivityRollup.record([(now, goose_sighting.quadkey)])
+        User.adjust_sightings_count(user.id, 1, now)
+        # Inserted after the bump so the row carries the version it commits under
+        goose_sighting.sync_version = CollectionVersion.bump(SIGHTINGS_COLLECTION)
+        goose_sighting.user = user
         db.session.add(goose_sighting)
-        db.session.commit()
+        commit_without_expiry()
+        forget_collection_version(SIGHTINGS_COLLECTION)
 
         debug_logger.debug(
             f"Submit goose sighting by {current_user}, name='{name}', "
@@ -66,6 +113,7 @@ def submit_sighting():
         )
 
         sighting_dict = goose_sighting.to_dict()
+        publish_sighting(sighting_dict)
         response = make_response(
             jsonify(
                 {
@@ -94,37 +142,239 @@ def submit_sighting():
         return jsonify({"error": "An unexpected error occurred"}), 500
 
 
+@main_bp.route("/submit-sightings", methods=["POST"])
+@jwt_required()
+def submit_sightings():
+    """
+    POST /api/submit-sightings
+    Adds a batch of goose sightings in one transaction and returns a result per item
+    """
+    try:
+        current_user = get_jwt_identity()
+        security_logger.info(
+            f"Submit goose sightings batch - IP: {request.remote_addr}"
+        )
+
+        user = User.query.filter_by(email=current_user).first()
+        if not user:
+            security_logger.warning(f"User does not exist - IP: {request.remote_addr}")
+            return jsonify({"error": "User does not exist"}), 500
+
+        data = request.get_json(silent=True)
+        if not isinstance(data, list) or not data:
+            return jsonify({"error": "Expected a non-empty JSON array"}), 400
+        if len(data) > current_app.config["SUBMIT_BATCH_MAX_SIZE"]:
+            return jsonify({"error": "Too many sightings in one batch"}), 400
+
+        # Run every item through the Sighting validators before inserting any
+        now = datetime.datetime.utcnow()
+        results = []
+        values = []
+        for index, item in enumerate(data):
+            try:
+                if not isinstance(item, dict):
+                    raise TypeError("Sighting must be an object")
+
+                goose_sighting = Sighting(
+                    id=uuid.uuid4(),
+                    name=bleach.clean(item.get("name")),
+                    notes=bleach.clean(item.get("notes")),
+                    coords=bleach.clean(item.get("coords")),
+                    image=bleach.clean(item.get("image")),
+                )
+            except (TypeError, ValueError) as e:
+                debug_logger.debug(f"Invalid goose sighting at index {index}: {e}")
+                results.append({"index": index, "status": 400, "error": "Invalid input"})
+                continue
+
+            values.append(
+                {
+                    "id": goose_sighting.id,
+                    "name": goose_sighting.name,
+                    "notes": goose_sighting.notes,
+                    "coords": goose_sighting.coords,
+                    "latitude": goose_sighting.latitude,
+                    "longitude": goose_sighting.longitude,
+                    "quadkey": goose_sighting.quadkey,
+                    "image": goose_sighting.image,
+                    "user_id": user.id,
+                    "created_date": now,
+                    "updated_at": now,
+                }
+            )
+            results.append({"index": index, "status": 201, "id": goose_sighting.id})
+
+        if not values:
+            return jsonify({"error": "No valid sightings", "results": results}), 400
+
+        SightingActivityRollup.record(
+            [(row["created_date"], row["quadkey"]) for row in values]
+        )
+        User.adjust_sightings_count(user.id, len(values), now)
+        sync_version = CollectionVersion.bump(SIGHTINGS_COLLECTION)
+        for row in values:
+            row["sync_version"] = sync_version
+        # One multi-row INSERT and one commit for the whole batch
+        db.session.execute(insert(Sighting), values)
+        db.session.commit()
+        forget_collection_version(SIGHTINGS_COLLECTION)
+
+        inserted = (
+            sighting_rows_query()
+            .filter(Sighting.id.in_([row["id"] for row in values]))
+            .all()
+        )
+        sightings_by_id = {}
+        for row in inserted:
+            sightings_by_id[row.id] = serialize_sighting_row(row)
+            publish_sighting(sightings_by_id[row.id])
+
+        for result in results:
+            if result["status"] == 201:
+                result["sighting"] = sightings_by_id[result.pop("id")]
+
+        debug_logger.debug(
+            f"Submit goose sightings batch by {current_user}, "
+            f"created: {len(values)}, rejected: {len(data) - len(values)}"
+        )
+        status = 201 if len(values) == len(data) else 207
+        return json_response({"results": results}, status=status)
+
+    except Exception as e:
+        db.session.rollback()  # does nothing if no transaction occured
+        security_logger.error(
+            f"Error: submit goose sightings batch - IP: {request.remote_addr}\n{e}"
+        )
+        debug_logger.error(f"Error: submit goose sightings batch\n{e}", exc_info=True)
+        return jsonify({"error": "An unexpected error occurred"}), 500
+
 @main_bp.route("/sightings", methods=["GET"])
+@read_only
 def sightings():
     """
     GET /api/sightings
-    Gets all active goose sightings in the database, optionally filtered by user ID
+    Gets active goose sightings in the database, optionally filtered by user ID
+    and by a ?bbox=minLat,minLng,maxLat,maxLng viewport.
+    Passing ?limit= and/or ?cursor= returns a newest-first page of sightings
+    along with a next_cursor for fetching the following page.
+    Passing ?since=<timestamp|sync token> returns only the sightings changed
+    and the ids deleted since then, with a next_since token for the next sync.
+    Honors If-None-Match / If-Modified-Since against the collection version,
+    and compresses large responses according to Accept-Encoding.
     """
     try:
         security_logger.info(f"Get goose sightings - IP: {request.remote_addr}")
 
+        # Answer repeat polls from the version counter without reading any rows
+        etag, last_modified = collection_validators(SIGHTINGS_COLLECTION)
+        if is_not_modified(etag, last_modified):
+            response = set_content_encoding(
+                current_app.response_class(status=304), None
+            )
+            return set_validators(response, etag, last_modified)
+
         user_id = request.args.get("user_id")
+        limit_arg = request.args.get("limit")
+        cursor = request.args.get("cursor")
+        bbox_arg = request.args.get("bbox")
+        since_arg = request.args.get("since")
+        encoding = negotiate_encoding()
 
+        query = sighting_rows_query()
+
+        user_uuid = None
         if user_id:
             try:
-                uuid.UUID(user_id, version=4)
+                user_uuid = uuid.UUID(user_id, version=4)
             except ValueError:
                 return jsonify({"error": "Invalid user_id format"}), 400
 
-            goose_sightings = (
-                Sighting.query.join(User).filter(Sighting.user_id == user_id).all()
+            query = query.filter(Sighting.user_id == user_uuid)
+            # Normalize the spelling so cache keys and tags match the writes' str(UUID)
+            user_id = str(user_uuid)
+
+        bbox = None
+        if bbox_arg:
+            try:
+                bbox = parse_bbox(bbox_arg)
+            except ValueError:
+                return jsonify({"error": "Invalid bbox format"}), 400
+
+            query = filter_bbox(query, bbox)
+
+        limit = None
+        if limit_arg is not None or cursor is not None or since_arg is not None:
+            try:
+                limit = parse_limit(
+                    limit_arg,
+                    current_app.config["SIGHTINGS_DEFAULT_PAGE_SIZE"],
+                    current_app.config["SIGHTINGS_MAX_PAGE_SIZE"],
+                )
+            except ValueError:
+                return jsonify({"error": "Invalid limit"}), 400
+
+        if since_arg is not None:
+            try:
+                since = parse_since(since_arg)
+            except InvalidCursor:
+                return jsonify({"error": "Invalid since"}), 400
+
+            rows, deleted_ids, next_since, has_more = sync_changes(
+                query, since, limit, user_uuid
+            )
+            debug_logger.debug(
+                f"Sync goose sightings, changed: {len(rows)}, deleted: {len(deleted_ids)}"
             )
+            body = dumps(
+                {
+                    "sightings": [serialize_sighting_row(row) for row in rows],
+                    "deleted": deleted_ids,
+                    "next_since": next_since,
+                    "has_more": has_more,
+                }
+            )
+            response = encoded_response(body, encoding)
+            return set_validators(response, etag, last_modified)
+
+        cache_key = listing_key(etag, user_id, bbox, limit, cursor)
+        cached = get_listing(cache_key, encoding)
+        if cached is not None:
+            debug_logger.debug("Get goose sightings, served from cache")
+            body, content_encoding = cached
+            response = current_app.response_class(body, mimetype="application/json")
+            set_content_encoding(response, content_encoding)
+            return set_validators(response, etag, last_modified)
+
+        if (
+            current_app.config["SIGHTINGS_JSON_MODE"] == "database"
+            and db_json_supported()
+        ):
+            try:
+                body = db_json_listing(query, limit, cursor)
+            except InvalidCursor:
+                return jsonify({"error": "Invalid cursor"}), 400
+            debug_logger.debug("Get goose sightings, assembled by the database")
         else:
-            goose_sightings = Sighting.query.join(User).all()
+            if limit is not None:
+                try:
+                    goose_sightings, next_cursor = paginate(query, limit, cursor)
+                except InvalidCursor:
+                    return jsonify({"error": "Invalid cursor"}), 400
+            else:
+                goose_sightings = query.all()
+                next_cursor = None
 
-        # Convert the sightings to a list of dictionaries
-        sightings_list = [sighting.to_dict() for sighting in goose_sightings]
+            # Convert the sighting rows to a list of dictionaries
+            sightings_list = [serialize_sighting_row(row) for row in goose_sightings]
 
-        debug_logger.debug(
-            f"Get goose sightings, number of sightings: {len(goose_sightings)}"
-        )
-        response = make_response(jsonify({"sightings": sightings_list}))
-        return response, 200
+            debug_logger.debug(
+                f"Get goose sightings, number of sightings: {len(goose_sightings)}"
+            )
+            body = dumps({"sightings": sightings_list, "next_cursor": next_cursor})
+
+        variants = set_listing(cache_key, body)
+        response = encoded_response(body, encoding, variants.get(encoding))
+        return set_validators(response, etag, last_modified)
 
     except Exception as e:
         security_logger.error(
@@ -132,3 +382,363 @@ def sightings():
         )
         debug_logger.error(f"Error: get goose sightings\n{e}", exc_info=True)
         return jsonify({"error": "An unexpected error occurred"}), 500
+
+
+@main_bp.route("/sightings/stream", methods=["GET"])
+def sightings_stream():
+    """
+    GET /api/sightings/stream?bbox=
+    Streams goose sightings as Server-Sent Events as soon as they are submitted,
+    optionally only those inside a ?bbox=minLat,minLng,maxLat,maxLng viewport
+    """
+    try:
+        security_logger.info(
+            f"Subscribe goose sighting stream - IP: {request.remote_addr}"
+        )
+
+        bbox = None
+        bbox_arg = request.args.get("bbox")
+        if bbox_arg:
+            try:
+                bbox = parse_bbox(bbox_arg)
+            except ValueError:
+                return jsonify({"error": "Invalid bbox format"}), 400
+
+        events = sighting_events(
+            pubsub.broker, bbox, current_app.config["SSE_KEEPALIVE_SECONDS"]
+        )
+        return current_app.response_class(
+            events,
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    except Exception as e:
+        security_logger.error(
+            f"Error: subscribe goose sighting stream - IP: {request.remote_addr}\n{e}"
+        )
+        debug_logger.error(f"Error: subscribe goose sighting stream\n{e}", exc_info=True)
+        return jsonify({"error": "An unexpected error occurred"}), 500
+
+@main_bp.route("/sightings/export", methods=["GET"])
+def sightings_export():
+    """
+    GET /api/sightings/export?format=ndjson|csv
+    Streams every goose sighting from a server-side cursor in constant memory,
+    as newline-delimited JSON (default) or CSV, compressed per Accept-Encoding
+    """
+    try:
+        security_logger.info(f"Export goose sightings - IP: {request.remote_addr}")
+
+        export_format = request.args.get("format", "ndjson")
+        batch_size = current_app.config["EXPORT_BATCH_SIZE"]
+
+        if export_format == "ndjson":
+            body, mimetype = ndjson_export(batch_size), "application/x-ndjson"
+        elif export_format == "csv":
+            body, mimetype = csv_export(batch_size), "text/csv"
+        else:
+            return jsonify({"error": "Invalid export format"}), 400
+
+        # Exports are always large, so they are compressed whenever the client
+        # accepts it rather than checking the size threshold up front
+        encoding = negotiate_encoding()
+        if encoding:
+            body = compress_stream(body, encoding)
+
+        response = current_app.response_class(
+            stream_with_context(body),
+            mimetype=mimetype,
+            headers={
+                "Content-Disposition": f"attachment; filename=sightings.{export_format}"
+            },
+        )
+        return set_content_encoding(response, encoding)
+
+    except Exception as e:
+        security_logger.error(
+            f"Error: export goose sightings - IP: {request.remote_addr}\n{e}"
+        )
+        debug_logger.error(f"Error: export goose sightings\n{e}", exc_info=True)
+        return jsonify({"error": "An unexpected error occurred"}), 500
+
+@main_bp.route("/sightings/search", methods=["GET"])
+def sightings_search():
+    """
+    GET /api/sightings/search?q=&limit=&cursor=
+    Full-text searches goose sighting names and notes, best match first,
+    returning a next_cursor for fetching the following page
+    """
+    try:
+        security_logger.info(f"Search goose sightings - IP: {request.remote_addr}")
+
+        q = request.args.get("q", "").strip()
+        if not q:
+            return jsonify({"error": "Search query is required"}), 400
+
+        try:
+            limit = parse_limit(
+                request.args.get("limit"),
+                current_app.config["SIGHTINGS_DEFAULT_PAGE_SIZE"],
+                current_app.config["SIGHTINGS_MAX_PAGE_SIZE"],
+            )
+        except ValueError:
+            return jsonify({"error": "Invalid limit"}), 400
+
+        try:
+            rows, next_cursor = search_sightings(q, limit, request.args.get("cursor"))
+        except InvalidCursor:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+        debug_logger.debug(
+            f"Search goose sightings for '{q}', number of results: {len(rows)}"
+        )
+        return json_response(
+            {
+                "sightings": [serialize_sighting_row(row) for row in rows],
+                "next_cursor": next_cursor,
+            }
+        )
+
+    except Exception as e:
+        security_logger.error(
+            f"Error: search goose sightings - IP: {request.remote_addr}\n{e}"
+        )
+        debug_logger.error(f"Error: search goose sightings\n{e}", exc_info=True)
+        return jsonify({"error": "An unexpected error occurred"}), 500
+
+@main_bp.route("/sightings/nearby", methods=["GET"])
+def sightings_nearby():
+    """
+    GET /api/sightings/nearby?lat=&lng=&k=&radius_m=
+    Gets the k goose sightings closest to a coordinate by great-circle distance,
+    nearest first, within radius_m metres
+    """
+    try:
+        security_logger.info(f"Get nearby goose sightings - IP: {request.remote_addr}")
+
+        try:
+            lat = float(request.args["lat"])
+            lng = float(request.args["lng"])
+            k = int(request.args.get("k", current_app.config["NEARBY_DEFAULT_K"]))
+            radius_m = float(
+                request.args.get(
+                    "radius_m", current_app.config["NEARBY_DEFAULT_RADIUS_M"]
+                )
+            )
+        except (KeyError, ValueError):
+            return jsonify({"error": "Invalid nearby query"}), 400
+
+        if not (
+            -90 <= lat <= 90
+            and -180 <= lng <= 180
+            and 1 <= k <= current_app.config["NEARBY_MAX_K"]
+            and 0 < radius_m <= current_app.config["NEARBY_MAX_RADIUS_M"]
+        ):
+            return jsonify({"error": "Invalid nearby query"}), 400
+
+        nearest = nearest_sightings(sighting_rows_query(), lat, lng, k, radius_m)
+
+        sightings_list = []
+        for row, distance in nearest:
+            sighting_dict = serialize_sighting_row(row)
+            sighting_dict["distance_m"] = round(distance, 1)
+            sightings_list.append(sighting_dict)
+
+        debug_logger.debug(
+            f"Get nearby goose sightings, number of sightings: {len(sightings_list)}"
+        )
+        return json_response({"sightings": sightings_list})
+
+    except Exception as e:
+        security_logger.error(
+            f"Error: get nearby goose sightings - IP: {request.remote_addr}\n{e}"
+        )
+        debug_logger.error(f"Error: get nearby goose sightings\n{e}", exc_info=True)
+        return jsonify({"error": "An unexpected error occurred"}), 500
+
+@main_bp.route("/sightings/heatmap", methods=["GET"])
+def sightings_heatmap():
+    """
+    GET /api/sightings/heatmap?bbox=&resolution=&half_life_days=
+    Gets a resolution x resolution grid of sighting counts over the bbox,
+    optionally time-decayed so older sightings count for less
+    """
+    try:
+        security_logger.info(f"Get goose sighting heatmap - IP: {request.remote_addr}")
+
+        try:
+            bbox = parse_bbox(request.args["bbox"])
+        except (KeyError, ValueError):
+            return jsonify({"error": "Invalid bbox format"}), 400
+
+        try:
+            resolution = int(
+                request.args.get(
+                    "resolution", current_app.config["HEATMAP_DEFAULT_RESOLUTION"]
+                )
+            )
+            half_life_days = request.args.get("half_life_days")
+            half_life_days = float(half_life_days) if half_life_days else None
+        except ValueError:
+            return jsonify({"error": "Invalid heatmap query"}), 400
+
+        if not 1 <= resolution <= current_app.config["HEATMAP_MAX_RESOLUTION"]:
+            return jsonify({"error": "Invalid heatmap query"}), 400
+        if half_life_days is not None and half_life_days <= 0:
+            return jsonify({"error": "Invalid heatmap query"}), 400
+
+        grid = heatmap_grid(bbox, resolution, half_life_days)
+        if half_life_days:
+            grid = grid.round(3)
+        else:
+            grid = grid.astype(int)
+
+        debug_logger.debug(
+            f"Get goose sighting heatmap, resolution: {resolution}, total: {grid.sum()}"
+        )
+        return json_response(
+            {
+                "bbox": list(bbox),
+                "resolution": resolution,
+                "max": grid.max().item(),
+                "grid": grid.tolist(),
+            }
+        )
+
+    except Exception as e:
+        security_logger.error(
+            f"Error: get goose sighting heatmap - IP: {request.remote_addr}\n{e}"
+        )
+        debug_logger.error(f"Error: get goose sighting heatmap\n{e}", exc_info=True)
+        return jsonify({"error": "An unexpected error occurred"}), 500
+
+@main_bp.route("/sightings/clusters", methods=["GET"])
+def sighting_clusters():
+    """
+    GET /api/sightings/clusters?bbox=&zoom=
+    Gets goose sightings grouped into grid cells sized for the map zoom level.
+    Past the configured zoom threshold the individual sightings inside the
+    bbox are returned instead, so bbox is required there.
+    """
+    try:
+        security_logger.info(
+            f"Get goose sighting clusters - IP: {request.remote_addr}"
+        )
+
+        try:
+            zoom = int(request.args.get("zoom", ""))
+        except ValueError:
+            return jsonify({"error": "Invalid zoom"}), 400
+        if not 0 <= zoom <= current_app.config["MAP_MAX_ZOOM"]:
+            return jsonify({"error": "Invalid zoom"}), 400
+
+        bbox = None
+        bbox_arg = request.args.get("bbox")
+        if bbox_arg:
+            try:
+                bbox = parse_bbox(bbox_arg)
+            except ValueError:
+                return jsonify({"error": "Invalid bbox format"}), 400
+
+        if zoom >= current_app.config["SIGHTINGS_CLUSTER_MAX_ZOOM"]:
+            if not bbox:
+                return jsonify({"error": "bbox is required at this zoom"}), 400
+
+            goose_sightings = filter_bbox(sighting_rows_query(), bbox).all()
+
+            debug_logger.debug(
+                f"Get goose sighting clusters at zoom {zoom}, "
+                f"number of sightings: {len(goose_sightings)}"
+            )
+            return json_response(
+                {
+                    "clustered": False,
+                    "sightings": [serialize_sighting_row(row) for row in goose_sightings],
+                }
+            )
+
+        clusters = cluster_sightings(
+            bbox, zoom, current_app.config["SIGHTINGS_CLUSTER_CELLS_PER_TILE"]
+        )
+
+        debug_logger.debug(
+            f"Get goose sighting clusters at zoom {zoom}, "
+            f"number of clusters: {len(clusters)}"
+        )
+        return jsonify({"clustered": True, "clusters": clusters}), 200
+
+    except Exception as e:
+        security_logger.error(
+            f"Error: get goose sighting clusters - IP: {request.remote_addr}\n{e}"
+        )
+        debug_logger.error(f"Error: get goose sighting clusters\n{e}", exc_info=True)
+        return jsonify({"error": "An unexpected error occurred"}), 500
+
+
+@main_bp.route("/sightings/<string:sighting_id>", methods=["DELETE"])
+@jwt_required()
+def delete_sighting(sighting_id):
+    """
+    DELETE /api/sightings/<sighting_id>
+    Deletes one of the current user's goose sightings, leaving a tombstone for delta sync
+    """
+    try:
+        sighting_uuid = uuid.UUID(sighting_id)
+    except ValueError:
+        return jsonify({"error": "Invalid sighting ID format"}), 404
+
+    try:
+        current_user = get_jwt_identity()
+        security_logger.info(
+            f"Delete goose sighting - Sighting ID: {sighting_id}, IP: {request.remote_addr}"
+        )
+
+        user = User.query.filter_by(email=current_user).first()
+        if not user:
+            security_logger.warning(f"User does not exist - IP: {request.remote_addr}")
+            return jsonify({"error": "User does not exist"}), 500
+
+        goose_sighting = db.session.get(Sighting, sighting_uuid)
+        if not goose_sighting:
+            return jsonify({"error": "Sighting not found"}), 404
+
+        if goose_sighting.user_id != user.id:
+            security_logger.warning(
+                f"Delete goose sighting forbidden - Sighting ID: {sighting_id}, "
+                f"IP: {request.remote_addr}"
+            )
+            return jsonify({"error": "Cannot delete another user's sighting"}), 403
+
+        SightingActivityRollup.record(
+            [(goose_sighting.created_date, goose_sighting.quadkey)], delta=-1
+        )
+        db.session.delete(goose_sighting)
+        db.session.flush()
+        User.adjust_sightings_count(
+            user.id,
+            -1,
+            select(func.max(Sighting.created_date))
+            .where(Sighting.user_id == user.id)
+            .scalar_subquery(),
+        )
+        db.session.add(
+            SightingTombstone(
+                sighting_id=goose_sighting.id,
+                user_id=user.id,
+                sync_version=CollectionVersion.bump(SIGHTINGS_COLLECTION),
+            )
+        )
+        db.session.commit()
+        forget_collection_version(SIGHTINGS_COLLECTION)
+
+        debug_logger.debug(f"Goose sighting {sighting_id} deleted by {current_user}")
+        return jsonify({"msg": "Successfully deleted goose sighting"}), 200
+
+    except Exception as e:
+        db.session.rollback()  # does nothing if no transaction occured
+        security_logger.error(
+            f"Error: delete goose sighting - IP: {request.remote_addr}\n{e}"
+        )
+        debug_logger.error(f"Error: delete goose sighting\n{e}", exc_info=True)
+        return jsonify({"error": "An unexpected error occurred"}), 500
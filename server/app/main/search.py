@@ -0,0 +1,88 @@
+"""Ranked full-text search over sighting names and notes"""
+
+import re
+import uuid
+
+from sqlalchemy import and_, cast, column, func, literal_column, or_, table
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
+
+from app.main.pagination import InvalidCursor, decode_token, encode_token
+from app.main.serializers import sighting_rows_query
+from app.models.sightings import Sighting
+from app import db
+
+sightings_fts = table("sightings_fts", column("rowid"))
+
+
+def _postgres_match(q):
+    """Match against the GIN-indexed search_vector column, ranked by ts_rank"""
+    search_vector = literal_column("sightings.search_vector")
+    tsquery = func.websearch_to_tsquery("english", q)
+    # ts_rank returns real; as double precision the rank in a cursor compares
+    # exactly equal to the database value, so ties at page boundaries hold
+    rank = cast(func.ts_rank(search_vector, tsquery), DOUBLE_PRECISION)
+    return search_vector.op("@@")(tsquery), rank
+
+
+def _sqlite_match(q):
+    """
+    Match against the sightings_fts FTS5 table, ranked by bm25.
+    Returns (None, None) when q has no words, since FTS5 rejects an empty MATCH.
+    """
+    words = re.findall(r"\w+", q)
+    if not words:
+        return None, None
+
+    # Quote each word so user input cannot inject FTS5 query syntax
+    terms = " ".join(f'"{word}"' for word in words)
+    fts = literal_column("sightings_fts")
+    # bm25 is lower for better matches, so negate it to rank descending
+    return fts.op("MATCH")(terms), -func.bm25(fts)
+
+
+def search_sightings(q, limit, cursor=None):
+    """
+    Return (rows, next_cursor) for sightings matching q, best match first.
+    Pages are keyset-paginated on (rank, id) like the listing endpoint.
+    """
+    if db.engine.dialect.name == "postgresql":
+        match, rank = _postgres_match(q)
+        query = sighting_rows_query().filter(match)
+    else:
+        match, rank = _sqlite_match(q)
+        if match is None:
+            return [], None
+        query = (
+            sighting_rows_query()
+            .join(
+                sightings_fts,
+                sightings_fts.c.rowid == literal_column("sightings.rowid"),
+            )
+            .filter(match)
+        )
+
+    if cursor:
+        try:
+            cursor_rank, cursor_id = decode_token(cursor)
+            cursor_rank, cursor_id = float(cursor_rank), uuid.UUID(cursor_id)
+        except (TypeError, ValueError) as e:
+            raise InvalidCursor("Invalid cursor") from e
+
+        query = query.filter(
+            or_(rank < cursor_rank, and_(rank == cursor_rank, Sighting.id < cursor_id))
+        )
+
+    rows = (
+        query.add_columns(rank.label("rank"))
+        .order_by(rank.desc(), Sighting.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_token([rows[-1].rank, str(rows[-1].id)])
+
+    # Drop the trailing rank column so rows match the listing layout
+    return [row[:-1] for row in rows], next_cursor
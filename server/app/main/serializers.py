@@ -0,0 +1,97 @@
+"""Fast serialization path for sighting listings"""
+
+import datetime
+import json
+import uuid
+
+from flask import Response
+
+from app.models.sightings import Sighting
+from app.models.user import User
+from app import db
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the deployment
+    orjson = None
+
+# Columns selected for listings, labelled so rows expose .id and .created_date
+# like Sighting instances do (keyset pagination relies on both)
+SIGHTING_LISTING_COLUMNS = (
+    Sighting.id.label("id"),
+    Sighting.name.label("name"),
+    Sighting.notes.label("notes"),
+    Sighting.image.label("image"),
+    Sighting.created_date.label("created_date"),
+    Sighting.updated_at.label("updated_at"),
+    Sighting.latitude.label("latitude"),
+    Sighting.longitude.label("longitude"),
+    User.id.label("user_id"),
+    User.username.label("username"),
+    User.description.label("description"),
+    User.profile_picture.label("profile_picture"),
+    User.is_banned.label("is_banned"),
+)
+
+
+def sighting_rows_query():
+    """Query for plain sighting row tuples joined to the public user columns"""
+    return db.session.query(*SIGHTING_LISTING_COLUMNS).join(
+        User, Sighting.user_id == User.id
+    )
+
+
+def serialize_sighting_row(row):
+    """Convert a listing row into the same layout as Sighting.to_dict"""
+    (
+        sighting_id,
+        name,
+        notes,
+        image,
+        created_date,
+        updated_at,
+        latitude,
+        longitude,
+        user_id,
+        username,
+        description,
+        profile_picture,
+        is_banned,
+    ) = row
+    return {
+        "id": sighting_id,
+        "name": name,
+        "notes": notes,
+        "image": image,
+        "created_date": created_date,
+        "updated_at": updated_at,
+        "coords": {"lat": latitude, "lng": longitude},
+        "user": {
+            "id": user_id,
+            "username": username,
+            "description": description,
+            "profile_picture": profile_picture,
+            "is_banned": is_banned,
+        },
+    }
+
+
+def _default(value):
+    """Encode the UUID and datetime values left in serialized rows"""
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload):
+    """Encode a payload to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, default=_default, separators=(",", ":")).encode()
+
+
+def json_response(payload, status=200):
+    """Build a JSON response without going through jsonify"""
+    return Response(dumps(payload), status=status, mimetype="application/json")
@@ -0,0 +1,43 @@
+"""Session modes for read-only and write endpoints"""
+
+import functools
+
+from app import db
+
+
+def read_only(view):
+    """
+    Run a view in a read-only session. Autoflush is disabled, Postgres runs the
+    transaction as READ ONLY, and the transaction is rolled back as soon as the
+    view returns, so its connection goes back to the pool before the response
+    is sent.
+    """
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        session = db.session()
+        if db.engine.dialect.name == "postgresql":
+            # Applied when the connection is checked out, so it costs no round-trip
+            session.connection(execution_options={"postgresql_readonly": True})
+        try:
+            with session.no_autoflush:
+                return view(*args, **kwargs)
+        finally:
+            session.rollback()
+
+    return wrapper
+
+
+def commit_without_expiry():
+    """
+    Commit the current transaction without expiring loaded objects. Write
+    endpoints build their response from the values they just wrote, so the
+    default expire_on_commit would only make them SELECT those rows again.
+    """
+    session = db.session()
+    expire_on_commit = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        session.commit()
+    finally:
+        session.expire_on_commit = expire_on_commit
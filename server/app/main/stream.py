@@ -0,0 +1,57 @@
+"""Server-Sent Events stream of newly submitted sightings"""
+
+import json
+import logging
+
+from app import pubsub
+from app.main.geo import bbox_contains
+from app.main.serializers import dumps
+
+SIGHTINGS_CHANNEL = "sightings"
+
+debug_logger = logging.getLogger("debug")
+
+
+def publish_sighting(sighting_dict):
+    """Push a committed sighting to every stream subscriber, across workers"""
+    try:
+        pubsub.broker.publish(SIGHTINGS_CHANNEL, dumps(sighting_dict).decode())
+    except Exception as e:
+        # The sighting is already committed; subscribers can catch up with ?since=
+        debug_logger.error(f"Error publishing goose sighting\n{e}", exc_info=True)
+
+
+def format_event(data, event=None, event_id=None):
+    """Format one Server-Sent Events message"""
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {data}")
+    return "\n".join(lines) + "\n\n"
+
+
+def sighting_events(broker, bbox, keepalive_seconds):
+    """Yield SSE messages for published sightings inside the subscriber's bbox"""
+    # Subscribing inside the generator ties the subscription to the response's lifetime
+    subscription = broker.subscribe(SIGHTINGS_CHANNEL)
+    try:
+        # Tell EventSource to reconnect after a dropped connection
+        yield f"retry: {keepalive_seconds * 1000}\n\n"
+
+        while True:
+            message = subscription.get(timeout=keepalive_seconds)
+            if message is None:
+                # Comment line keeps proxies from closing an idle connection
+                yield ": keepalive\n\n"
+                continue
+
+            sighting = json.loads(message)
+            coords = sighting.get("coords")
+            if bbox and not (coords and bbox_contains(bbox, coords["lat"], coords["lng"])):
+                continue
+
+            yield format_event(message, event="sighting", event_id=sighting["id"])
+    finally:
+        subscription.close()
@@ -0,0 +1,68 @@
+"""Sighting activity rollup model definition"""
+
+import datetime
+from collections import Counter
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app import db
+
+ROLLUP_BUCKETS = ("hour", "day")
+# Quadkey prefix length used as the rollup region cell (~40 km tiles)
+ROLLUP_CELL_ZOOM = 10
+
+
+def bucket_start(timestamp, bucket):
+    """Truncate a timestamp to the start of its hour, day or (Monday-based) week"""
+    if bucket == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    day = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    if bucket == "week":
+        return day - datetime.timedelta(days=day.weekday())
+    return day
+
+
+class SightingActivityRollup(db.Model):
+    """Number of sightings per region cell per hour or day bucket"""
+
+    __tablename__ = "sighting_activity_rollups"
+
+    bucket = db.Column(db.String(8), primary_key=True)
+    bucket_start = db.Column(db.DateTime, primary_key=True)
+    cell = db.Column(db.String(ROLLUP_CELL_ZOOM), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+    @classmethod
+    def record(cls, sightings, delta=1):
+        """
+        Add delta to the rollups of each (created_date, quadkey) pair as part of
+        the current transaction, using one upsert for all affected buckets
+        """
+        counts = Counter()
+        for created_date, quadkey in sightings:
+            if created_date is None:
+                continue
+            for bucket in ROLLUP_BUCKETS:
+                key = (bucket, bucket_start(created_date, bucket), quadkey[:ROLLUP_CELL_ZOOM])
+                counts[key] += delta
+
+        if not counts:
+            return
+
+        dialect_insert = (
+            postgresql.insert
+            if db.session.get_bind().dialect.name == "postgresql"
+            else sqlite.insert
+        )
+        statement = dialect_insert(cls.__table__)
+        statement = statement.on_conflict_do_update(
+            index_elements=["bucket", "bucket_start", "cell"],
+            set_={"count": cls.__table__.c.count + statement.excluded.count},
+        )
+        db.session.execute(
+            statement,
+            [
+                {"bucket": bucket, "bucket_start": start, "cell": cell, "count": count}
+                for (bucket, start, cell), count in counts.items()
+            ],
+        )
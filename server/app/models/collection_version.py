@@ -0,0 +1,51 @@
+"""Collection version model definition"""
+
+import datetime
+from sqlalchemy import update
+from app import db
+
+SIGHTINGS_COLLECTION = "sightings"
+
+
+class CollectionVersion(db.Model):
+    """Version counter bumped whenever a cached collection changes"""
+
+    __tablename__ = "collection_versions"
+
+    name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime(timezone=True), nullable=False)
+
+    @classmethod
+    def bump(cls, name):
+        """
+        Increment a collection's version as part of the current transaction and
+        return the new version. The UPDATE locks the row until commit, so
+        versions become visible in the order they were handed out.
+        """
+        now = datetime.datetime.now(datetime.timezone.utc)
+        version = db.session.execute(
+            update(cls)
+            .where(cls.name == name)
+            .values(version=cls.version + 1, updated_at=now)
+            .returning(cls.version)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        if version is None:
+            version = 1
+            db.session.add(cls(name=name, version=version, updated_at=now))
+        return version
+
+    @classmethod
+    def current(cls, name):
+        """Return (version, updated_at) for a collection, or (0, None) if never written"""
+        row = (
+            db.session.query(cls.version, cls.updated_at).filter_by(name=name).first()
+        )
+        if not row:
+            return 0, None
+
+        version, updated_at = row
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=datetime.timezone.utc)
+        return version, updated_at
@@ -10,6 +10,8 @@ class Image(db.Model):
 
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     s3_url = db.Column(db.String(256), nullable=False)
+    # SHA-256 of the stored bytes, used as a strong ETag; NULL for older uploads
+    content_hash = db.Column(db.String(64), nullable=True)
 
     @validates('s3_url')
     def validate_s3_url(self, key, s3_url):
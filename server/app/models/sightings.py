@@ -3,11 +3,13 @@
 import uuid
 import re
 import datetime
+from sqlalchemy import DDL, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import validates, relationship
 from werkzeug.security import generate_password_hash, check_password_hash
 from dataclasses import dataclass
 from app.models.user import User
+from app.tiles.quadkey import QUADKEY_ZOOM, latlng_to_quadkey
 from app import db
 
 
@@ -20,18 +22,47 @@ class Sighting(db.Model):
     name: str
     notes: str
     coords: str
+    latitude: float
+    longitude: float
+    quadkey: str
     image: str
     user_id: str
     created_date: datetime.datetime
+    updated_at: datetime.datetime
 
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = db.Column(db.String(80), nullable=False)
     notes = db.Column(db.Text, nullable=True)
     coords = db.Column(db.String(80), nullable=False)
+    # Numeric copies of coords, kept in sync by validate_coords for bbox queries
+    latitude = db.Column(db.Float, nullable=False)
+    longitude = db.Column(db.Float, nullable=False)
+    # Map tile of the coordinates at QUADKEY_ZOOM, used for tile range lookups
+    quadkey = db.Column(db.String(QUADKEY_ZOOM), nullable=False, index=True)
     image = db.Column(db.String(256), nullable=True)
     user_id = db.Column(UUID(as_uuid=True), db.ForeignKey("users.id"))
     user = relationship("User", back_populates="posts")
     created_date = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+    # Bumped on every change to the row or its embedded user fields, for delta sync
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=datetime.datetime.utcnow,
+        onupdate=datetime.datetime.utcnow,
+    )
+    # Collection version of the last change, from CollectionVersion.bump.
+    # Unlike updated_at it follows commit order, so delta sync walks it.
+    sync_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    # Keyset pagination walks these indexes in (created_date, id) order,
+    # and delta sync walks (sync_version, id)
+    __table_args__ = (
+        db.Index("ix_sightings_created_date_id", "created_date", "id"),
+        db.Index("ix_sightings_user_id_created_date_id", "user_id", "created_date", "id"),
+        db.Index("ix_sightings_latitude_longitude", "latitude", "longitude"),
+        db.Index("ix_sightings_updated_at_id", "updated_at", "id"),
+        db.Index("ix_sightings_sync_version_id", "sync_version", "id"),
+    )
 
     @validates("name")
     def validate_name(self, key, name):
@@ -75,6 +106,9 @@ class Sighting(db.Model):
             if not (-180 <= lng <= 180):
                 raise ValueError("Longitude must be between -180 and 180")
 
+            self.latitude = lat
+            self.longitude = lng
+            self.quadkey = latlng_to_quadkey(lat, lng)
             return coords
         except ValueError:
             raise ValueError("Coordinates must contain valid numbers")
@@ -100,14 +134,14 @@ class Sighting(db.Model):
             "created_date": (
                 self.created_date.isoformat() if self.created_date else None
             ),
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
 
-        # Parse the coordinates string into lat/lng object
-        if self.coords:
-            lat_str, lng_str = self.coords.split(",")
+        # Expose the numeric coordinate columns as a lat/lng object
+        if self.latitude is not None and self.longitude is not None:
             sighting_dict["coords"] = {
-                "lat": float(lat_str.strip()),
-                "lng": float(lng_str.strip()),
+                "lat": self.latitude,
+                "lng": self.longitude,
             }
         else:
             sighting_dict["coords"] = None
@@ -125,3 +159,56 @@ class Sighting(db.Model):
             sighting_dict["user"] = None
 
         return sighting_dict
+
+
+
+# Full-text search index over name and notes: a generated tsvector column with
+# a GIN index on Postgres, and an FTS5 table kept in sync by triggers on SQLite
+for statement in (
+    "ALTER TABLE sightings ADD COLUMN search_vector tsvector GENERATED ALWAYS AS "
+    "(to_tsvector('english', coalesce(name, '') || ' ' || coalesce(notes, ''))) STORED",
+    "CREATE INDEX ix_sightings_search_vector ON sightings USING GIN (search_vector)",
+):
+    event.listen(
+        Sighting.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql")
+    )
+
+for statement in (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS sightings_fts USING fts5("
+    "name, notes, content='sightings', content_rowid='rowid')",
+    "CREATE TRIGGER sightings_fts_ai AFTER INSERT ON sightings BEGIN "
+    "INSERT INTO sightings_fts(rowid, name, notes) VALUES (new.rowid, new.name, new.notes); "
+    "END",
+    "CREATE TRIGGER sightings_fts_ad AFTER DELETE ON sightings BEGIN "
+    "INSERT INTO sightings_fts(sightings_fts, rowid, name, notes) "
+    "VALUES ('delete', old.rowid, old.name, old.notes); "
+    "END",
+    "CREATE TRIGGER sightings_fts_au AFTER UPDATE ON sightings BEGIN "
+    "INSERT INTO sightings_fts(sightings_fts, rowid, name, notes) "
+    "VALUES ('delete', old.rowid, old.name, old.notes); "
+    "INSERT INTO sightings_fts(rowid, name, notes) VALUES (new.rowid, new.name, new.notes); "
+    "END",
+):
+    event.listen(
+        Sighting.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+
+event.listen(
+    Sighting.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS sightings_fts").execute_if(dialect="sqlite"),
+)
+
+class SightingTombstone(db.Model):
+    """Record of a deleted sighting, so delta sync clients can drop it"""
+
+    __tablename__ = "sighting_tombstones"
+
+    sighting_id = db.Column(UUID(as_uuid=True), primary_key=True)
+    user_id = db.Column(UUID(as_uuid=True), nullable=True)
+    deleted_at = db.Column(
+        db.DateTime, nullable=False, default=datetime.datetime.utcnow, index=True
+    )
+    sync_version = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0", index=True
+    )
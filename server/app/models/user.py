@@ -1,5 +1,6 @@
 """User model definition"""
 import uuid
+from sqlalchemy import func, update
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from werkzeug.security import generate_password_hash, check_password_hash
@@ -19,6 +20,34 @@ class User(db.Model):
     posts = relationship("Sighting", back_populates="user")
     failed_login_attempts = db.Column(db.Integer, default=0)
     account_locked_until = db.Column(db.DateTime(timezone=True), nullable=True)
+    # Counter cache of the user's sightings, maintained by the sighting write paths
+    sightings_count = db.Column(db.Integer, nullable=False, default=0)
+    last_sighting_at = db.Column(db.DateTime, nullable=True)
+
+    @classmethod
+    def adjust_sightings_count(cls, user_id, delta, last_sighting_at):
+        """
+        Atomically add delta to a user's sightings count and set their last
+        sighting time, as part of the current transaction. When sightings are
+        added the time only moves forward, so writes committing out of order
+        cannot move it back; removals pass a recomputed time, which is set as-is.
+        """
+        if delta > 0:
+            # greatest() on Postgres, the multi-argument scalar max() on SQLite
+            later = func.greatest if db.engine.dialect.name == "postgresql" else func.max
+            last_sighting_at = later(
+                func.coalesce(cls.last_sighting_at, last_sighting_at), last_sighting_at
+            )
+
+        db.session.execute(
+            update(cls)
+            .where(cls.id == user_id)
+            .values(
+                sightings_count=cls.sightings_count + delta,
+                last_sighting_at=last_sighting_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
 
     def set_password(self, password_plaintext):
         """Set hashed password"""
@@ -0,0 +1,36 @@
+"""Publish/subscribe hub extension"""
+
+from flask import current_app
+
+from app.pubsub.brokers import LocalBroker, RedisBroker
+
+
+class PubSub:
+    """Flask extension holding the configured message broker"""
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        backend_name = app.config["PUBSUB_BACKEND"]
+        max_pending = app.config["PUBSUB_MAX_PENDING"]
+
+        if backend_name == "local":
+            broker = LocalBroker(max_pending=max_pending)
+        elif backend_name == "redis":
+            import redis  # pylint: disable=import-outside-toplevel
+
+            broker = RedisBroker(
+                redis.Redis.from_url(app.config["PUBSUB_REDIS_URL"]),
+                max_pending=max_pending,
+            )
+        else:
+            raise ValueError(f"Unknown PUBSUB_BACKEND '{backend_name}'")
+
+        app.extensions["pubsub"] = broker
+
+    @property
+    def broker(self):
+        """The current app's message broker"""
+        return current_app.extensions["pubsub"]
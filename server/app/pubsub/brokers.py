@@ -0,0 +1,145 @@
+"""Message brokers for the publish/subscribe hub"""
+
+import logging
+import queue
+import threading
+import time
+
+debug_logger = logging.getLogger("debug")
+
+
+class Subscription:
+    """A single subscriber's bounded queue of messages on one channel"""
+
+    def __init__(self, broker, channel, max_pending):
+        self.broker = broker
+        self.channel = channel
+        self.queue = queue.Queue(maxsize=max_pending)
+
+    def get(self, timeout):
+        """Wait up to timeout seconds for the next message, returning None if none arrives"""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class LocalBroker:
+    """Fans messages out to subscribers within the current process"""
+
+    def __init__(self, max_pending=100):
+        self.max_pending = max_pending
+        self._subscriptions = {}  # channel -> set of Subscription
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel):
+        subscription = Subscription(self, channel, self.max_pending)
+        with self._lock:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+
+    def publish(self, channel, message):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+
+        for subscription in subscriptions:
+            try:
+                subscription.queue.put_nowait(message)
+            except queue.Full:
+                # Drop messages for a stalled subscriber rather than block the publisher
+                pass
+
+
+class RedisBroker:
+    """
+    Fans messages out across worker processes through Redis pub/sub (or
+    anything exposing the same publish/pubsub/psubscribe/listen commands).
+    Each process runs one listener thread that relays into a LocalBroker,
+    reconnecting with exponential backoff if the connection drops.
+    """
+
+    def __init__(
+        self,
+        client,
+        prefix="honkspotter:",
+        max_pending=100,
+        retry_delay=0.5,
+        max_retry_delay=30,
+    ):
+        self.client = client
+        self.prefix = prefix
+        self.local = LocalBroker(max_pending=max_pending)
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel):
+        self._ensure_listener()
+        return self.local.subscribe(channel)
+
+    def unsubscribe(self, subscription):
+        self.local.unsubscribe(subscription)
+
+    def publish(self, channel, message):
+        self.client.publish(self.prefix + channel, message)
+
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener is not None:
+                return
+
+            # Subscribe before returning so no message published after
+            # subscribe() is missed; the thread handles any reconnects
+            self._listener = threading.Thread(
+                target=self._relay, args=(self._connect(),), daemon=True
+            )
+            self._listener.start()
+
+    def _connect(self):
+        pubsub = self.client.pubsub()
+        pubsub.psubscribe(self.prefix + "*")
+        return pubsub
+
+    def _relay(self, pubsub):
+        delay = self.retry_delay
+        while True:
+            try:
+                if pubsub is None:
+                    pubsub = self._connect()
+                for message in pubsub.listen():
+                    delay = self.retry_delay
+                    self._relay_message(message)
+                debug_logger.error("Pub/sub listener stopped, reconnecting")
+            except Exception:
+                debug_logger.error(
+                    f"Pub/sub listener failed, reconnecting in {delay}s", exc_info=True
+                )
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+                pubsub = None
+            time.sleep(delay)
+            delay = min(delay * 2, self.max_retry_delay)
+
+    def _relay_message(self, message):
+        if message["type"] != "pmessage":
+            return
+
+        channel, data = message["channel"], message["data"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        if isinstance(data, bytes):
+            data = data.decode()
+        self.local.publish(channel[len(self.prefix) :], data)
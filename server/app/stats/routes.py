@@ -0,0 +1,106 @@
+"""Statistics routes"""
+
+import datetime
+import logging
+
+from flask import Blueprint, request, jsonify, current_app
+from sqlalchemy import func
+
+from app.models.activity import ROLLUP_CELL_ZOOM, SightingActivityRollup, bucket_start
+from app import db
+
+stats_bp = Blueprint("stats", __name__)
+security_logger = logging.getLogger("security")
+debug_logger = logging.getLogger("debug")
+
+BUCKET_SIZES = {
+    "hour": datetime.timedelta(hours=1),
+    "day": datetime.timedelta(days=1),
+    "week": datetime.timedelta(weeks=1),
+}
+
+
+def parse_timestamp(raw_timestamp):
+    """Parse an ISO 8601 query parameter into a naive UTC datetime"""
+    timestamp = datetime.datetime.fromisoformat(raw_timestamp)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+@stats_bp.route("/stats/activity", methods=["GET"])
+def activity():
+    """
+    GET /api/stats/activity?from=&to=&bucket=hour|day|week&cell=
+    Gets sighting counts per time bucket in [from, to), read only from the
+    incrementally maintained rollup tables, optionally for one region cell
+    """
+    try:
+        security_logger.info(f"Get sighting activity - IP: {request.remote_addr}")
+
+        bucket = request.args.get("bucket", "day")
+        if bucket not in BUCKET_SIZES:
+            return jsonify({"error": "Invalid bucket"}), 400
+
+        try:
+            end = (
+                parse_timestamp(request.args["to"])
+                if "to" in request.args
+                else datetime.datetime.utcnow()
+            )
+            start = (
+                parse_timestamp(request.args["from"])
+                if "from" in request.args
+                else end - datetime.timedelta(days=30)
+            )
+        except ValueError:
+            return jsonify({"error": "Invalid time range"}), 400
+
+        start = bucket_start(start, bucket)
+        if start >= end:
+            return jsonify({"error": "Invalid time range"}), 400
+        max_buckets = current_app.config["STATS_MAX_BUCKETS"]
+        if (end - start) / BUCKET_SIZES[bucket] > max_buckets:
+            return jsonify({"error": "Too many buckets, use a larger bucket"}), 400
+
+        cell = request.args.get("cell")
+        if cell is not None and (
+            len(cell) != ROLLUP_CELL_ZOOM or set(cell) - set("0123")
+        ):
+            return jsonify({"error": "Invalid cell"}), 400
+
+        # Weeks are summed from the daily rollups
+        rollup_bucket = "hour" if bucket == "hour" else "day"
+        query = db.session.query(
+            SightingActivityRollup.bucket_start,
+            func.sum(SightingActivityRollup.count),
+        ).filter(
+            SightingActivityRollup.bucket == rollup_bucket,
+            SightingActivityRollup.bucket_start >= start,
+            SightingActivityRollup.bucket_start < end,
+        )
+        if cell:
+            query = query.filter(SightingActivityRollup.cell == cell)
+
+        counts = {}
+        for rollup_start, count in query.group_by(SightingActivityRollup.bucket_start):
+            key = bucket_start(rollup_start, bucket)
+            counts[key] = counts.get(key, 0) + int(count)
+
+        series = []
+        current = start
+        while current < end:
+            series.append({"start": current.isoformat(), "count": counts.get(current, 0)})
+            current += BUCKET_SIZES[bucket]
+
+        debug_logger.debug(
+            f"Get sighting activity, bucket: {bucket}, buckets: {len(series)}"
+        )
+        return jsonify({"bucket": bucket, "series": series}), 200
+
+    except Exception as e:
+        security_logger.error(
+            f"Error: get sighting activity - IP: {request.remote_addr}\n{e}"
+        )
+        debug_logger.error(f"Error: get sighting activity\n{e}", exc_info=True)
+        return jsonify({"error": "An unexpected error occurred"}), 500
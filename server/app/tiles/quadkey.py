@@ -0,0 +1,46 @@
+"""Slippy-map (Web Mercator) tile and quadkey math"""
+
+import math
+
+# Zoom level at which each sighting's quadkey is precomputed; a tile at any
+# lower zoom is a prefix of the quadkeys of the sightings inside it
+QUADKEY_ZOOM = 22
+MAX_MERCATOR_LAT = 85.05112878
+
+
+def latlng_to_tile(lat, lng, zoom):
+    """Return the (x, y) slippy-map tile containing a coordinate at a zoom level"""
+    lat = max(-MAX_MERCATOR_LAT, min(MAX_MERCATOR_LAT, lat))
+    n = 2**zoom
+    x = int((lng + 180.0) / 360.0 * n)
+    lat_rad = math.radians(lat)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tile_to_quadkey(x, y, zoom):
+    """Encode a tile as a quadkey string with one base-4 digit per zoom level"""
+    digits = []
+    for level in range(zoom, 0, -1):
+        mask = 1 << (level - 1)
+        digit = 0
+        if x & mask:
+            digit += 1
+        if y & mask:
+            digit += 2
+        digits.append(str(digit))
+    return "".join(digits)
+
+
+def latlng_to_quadkey(lat, lng, zoom=QUADKEY_ZOOM):
+    """Return the quadkey of the tile containing a coordinate"""
+    x, y = latlng_to_tile(lat, lng, zoom)
+    return tile_to_quadkey(x, y, zoom)
+
+
+def quadkey_range(quadkey):
+    """
+    Return the half-open [low, high) string range covering every quadkey that
+    starts with the given prefix, so lookups can use a B-tree range scan.
+    """
+    return quadkey, quadkey + "4"
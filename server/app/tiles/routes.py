@@ -0,0 +1,65 @@
+"""Map tile routes"""
+
+import logging
+
+from flask import Blueprint, request, jsonify, current_app
+
+from app.main.serializers import json_response, serialize_sighting_row, sighting_rows_query
+from app.models.sightings import Sighting
+from app.tiles.quadkey import quadkey_range, tile_to_quadkey
+
+tiles_bp = Blueprint("tiles", __name__)
+security_logger = logging.getLogger("security")
+debug_logger = logging.getLogger("debug")
+
+
+@tiles_bp.route("/tiles/<int:z>/<int:x>/<int:y>", methods=["GET"])
+def get_tile(z, x, y):
+    """
+    GET /api/tiles/<z>/<x>/<y>
+    Gets the goose sightings inside a slippy-map tile. Responses carry a
+    content ETag and public Cache-Control so browsers and CDNs can reuse them
+    until a write changes the tile.
+    """
+    try:
+        security_logger.info(
+            f"Get sightings tile {z}/{x}/{y} - IP: {request.remote_addr}"
+        )
+
+        if not (
+            current_app.config["TILE_MIN_ZOOM"] <= z <= current_app.config["MAP_MAX_ZOOM"]
+        ):
+            return jsonify({"error": "Invalid tile zoom"}), 400
+        if not (0 <= x < 2**z and 0 <= y < 2**z):
+            return jsonify({"error": "Invalid tile coordinates"}), 400
+
+        low, high = quadkey_range(tile_to_quadkey(x, y, z))
+        goose_sightings = (
+            sighting_rows_query()
+            .filter(Sighting.quadkey >= low, Sighting.quadkey < high)
+            .all()
+        )
+
+        debug_logger.debug(
+            f"Get sightings tile {z}/{x}/{y}, number of sightings: {len(goose_sightings)}"
+        )
+
+        response = json_response(
+            {
+                "z": z,
+                "x": x,
+                "y": y,
+                "sightings": [serialize_sighting_row(row) for row in goose_sightings],
+            }
+        )
+        response.cache_control.public = True
+        response.cache_control.max_age = current_app.config["TILE_CACHE_MAX_AGE"]
+        response.add_etag()
+        return response.make_conditional(request)
+
+    except Exception as e:
+        security_logger.error(
+            f"Error: get sightings tile - IP: {request.remote_addr}\n{e}"
+        )
+        debug_logger.error(f"Error: get sightings tile\n{e}", exc_info=True)
+        return jsonify({"error": "An unexpected error occurred"}), 500
@@ -1,12 +1,20 @@
 import logging
 import uuid
+import datetime
 import bleach
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import select
 
 from app import db
 from app.models.user import User
+from app.models.sightings import Sighting
+from app.models.collection_version import CollectionVersion, SIGHTINGS_COLLECTION
+from app.main.conditional import forget_collection_version
+from app.main.pagination import encode_cursor, parse_limit
+from app.main.serializers import json_response, serialize_sighting_row
+from app.main.session import commit_without_expiry, read_only
 
 users_bp = Blueprint("users", __name__)
 security_logger = logging.getLogger("security")
@@ -14,6 +22,7 @@ debug_logger = logging.getLogger("debug")
 
 @users_bp.route("/user/<string:user_id>", methods=["GET"])
 @jwt_required()
+@read_only
 def get_user(user_id):
     """
     GET /api/user/<user_id>
@@ -38,8 +47,8 @@ def get_user(user_id):
             )
             return jsonify({"error": "Requesting user not found"}), 404
 
-        # Get the requested user from database
-        user = User.query.get(user_id)
+        # Get the requested user, from the identity map when it is the requester
+        user = db.session.get(User, uuid_obj)
         if not user:
             security_logger.warning(
                 f"Requested user not found - User ID: {user_id}, IP: {request.remote_addr}"
@@ -72,6 +81,142 @@ def get_user(user_id):
         return jsonify({"error": "Internal server error"}), 500
 
 
+def _user_summary_rows(user_id, limit):
+    """
+    Fetch a user's public profile, counters and newest limit + 1 sightings in a
+    single query by outer joining the user to a page of their sightings
+    """
+    page = (
+        select(
+            Sighting.id,
+            Sighting.name,
+            Sighting.notes,
+            Sighting.image,
+            Sighting.created_date,
+            Sighting.updated_at,
+            Sighting.latitude,
+            Sighting.longitude,
+            Sighting.user_id,
+        )
+        .where(Sighting.user_id == user_id)
+        .order_by(Sighting.created_date.desc(), Sighting.id.desc())
+        .limit(limit + 1)
+        .subquery()
+    )
+
+    return (
+        db.session.query(
+            User.id,
+            User.username,
+            User.description,
+            User.profile_picture,
+            User.is_banned,
+            User.sightings_count,
+            User.last_sighting_at,
+            page.c.id,
+            page.c.name,
+            page.c.notes,
+            page.c.image,
+            page.c.created_date,
+            page.c.updated_at,
+            page.c.latitude,
+            page.c.longitude,
+        )
+        .outerjoin(page, page.c.user_id == User.id)
+        .filter(User.id == user_id)
+        .order_by(page.c.created_date.desc(), page.c.id.desc())
+        .all()
+    )
+
+
+@users_bp.route("/user/<string:user_id>/summary", methods=["GET"])
+@jwt_required()
+@read_only
+def get_user_summary(user_id):
+    """
+    GET /api/user/<user_id>/summary?limit=N
+    Returns a user's profile, sighting counters and first page of sightings
+    """
+    try:
+        uuid_obj = uuid.UUID(user_id)
+    except ValueError:
+        return jsonify({"error": "Invalid user ID format"}), 404
+
+    try:
+        limit = parse_limit(
+            request.args.get("limit"),
+            current_app.config["SIGHTINGS_DEFAULT_PAGE_SIZE"],
+            current_app.config["SIGHTINGS_MAX_PAGE_SIZE"],
+        )
+    except ValueError:
+        return jsonify({"error": "Limit must be a positive integer"}), 400
+
+    try:
+        current_user_email = get_jwt_identity()
+        security_logger.info(
+            f"Get user summary attempt - User ID: {user_id}, IP: {request.remote_addr}"
+        )
+
+        # Verify the requesting user exists
+        requesting_user = User.query.filter_by(email=current_user_email).first()
+        if not requesting_user:
+            security_logger.warning(
+                f"Requesting user not found for user summary request - IP: {request.remote_addr}"
+            )
+            return jsonify({"error": "Requesting user not found"}), 404
+
+        rows = _user_summary_rows(uuid_obj, limit)
+        if not rows:
+            security_logger.warning(
+                f"Requested user not found - User ID: {user_id}, IP: {request.remote_addr}"
+            )
+            return jsonify({"error": "Requested user not found"}), 404
+
+        (
+            _,
+            username,
+            description,
+            profile_picture,
+            is_banned,
+            sightings_count,
+            last_sighting_at,
+        ) = rows[0][:7]
+        user_data = {
+            "id": str(uuid_obj),
+            "username": username,
+            "description": description,
+            "profile_picture": profile_picture,
+            "is_banned": is_banned,
+            "sightings_count": sightings_count,
+            "last_sighting_at": last_sighting_at,
+        }
+
+        # A user without sightings still comes back as one row of NULL sighting columns
+        page = [row[7:] for row in rows if row[7] is not None]
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = encode_cursor(page[-1][4], page[-1][0])
+
+        user_columns = (uuid_obj, username, description, profile_picture, is_banned)
+        sightings = [serialize_sighting_row(tuple(row) + user_columns) for row in page]
+
+        debug_logger.debug(
+            f"User {current_user_email} retrieved summary of user {user_id} successfully"
+        )
+
+        return json_response(
+            {"user": user_data, "sightings": sightings, "next_cursor": next_cursor}
+        )
+
+    except Exception as e:
+        security_logger.error(
+            f"Get user summary error - User ID: {user_id}, IP: {request.remote_addr}"
+        )
+        debug_logger.error(f"Get user summary error: {str(e)}", exc_info=True)
+        return jsonify({"error": "Internal server error"}), 500
+
+
 @users_bp.route("/update-profile", methods=["POST"])
 @jwt_required()
 def update_profile():
@@ -127,8 +272,20 @@ def update_profile():
         if "profile_picture" in data:
             user.profile_picture = bleach.clean(data["profile_picture"])
 
-        # Save changes
-        db.session.commit()
+        # Sightings embed these profile fields, so cached listings are now stale
+        # and delta sync clients need to refetch this user's sightings
+        sync_version = CollectionVersion.bump(SIGHTINGS_COLLECTION)
+        Sighting.query.filter_by(user_id=user.id).update(
+            {
+                Sighting.updated_at: datetime.datetime.utcnow(),
+                Sighting.sync_version: sync_version,
+            },
+            synchronize_session=False,
+        )
+
+        # Save changes, keeping the loaded user for the response
+        commit_without_expiry()
+        forget_collection_version(SIGHTINGS_COLLECTION)
 
         debug_logger.debug(f"User {current_user_email} updated profile successfully")
         security_logger.info(
@@ -0,0 +1,97 @@
+"""
+Micro-benchmark comparing the ORM + to_dict + jsonify sightings listing with
+the row tuple + fast JSON encoder path used by GET /api/sightings.
+
+Run from the server directory:
+
+    python benchmarks/bench_sightings_serialization.py
+"""
+
+import datetime
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ["DATABASE_URI"] = "sqlite:///:memory:"
+
+from flask import jsonify  # pylint: disable=wrong-import-position
+
+from app import create_app, db  # pylint: disable=wrong-import-position
+from app.main.serializers import (  # pylint: disable=wrong-import-position
+    dumps,
+    serialize_sighting_row,
+    sighting_rows_query,
+)
+from app.models.sightings import Sighting  # pylint: disable=wrong-import-position
+from app.models.user import User  # pylint: disable=wrong-import-position
+
+ROW_COUNTS = (1_000, 10_000, 100_000)
+USER_COUNT = 50
+
+
+def seed(row_count):
+    """Bulk insert row_count sightings spread across USER_COUNT users"""
+    db.drop_all()
+    db.create_all()
+
+    users = [
+        {"id": uuid.uuid4(), "email": f"bench{i}@test.com", "username": f"bench{i}",
+         "password": "unused", "description": "Benchmark user", "is_banned": False}
+        for i in range(USER_COUNT)
+    ]
+    db.session.execute(User.__table__.insert(), users)
+
+    now = datetime.datetime.utcnow()
+    sightings = [
+        {"id": uuid.uuid4(), "name": f"goose {i}", "notes": "Benchmark notes",
+         "coords": "43.4647,-80.5281", "latitude": 43.4647, "longitude": -80.5281,
+         "quadkey": "0" * 22, "image": None, "user_id": users[i % USER_COUNT]["id"],
+         "created_date": now - datetime.timedelta(seconds=i)}
+        for i in range(row_count)
+    ]
+    db.session.execute(Sighting.__table__.insert(), sightings)
+    db.session.commit()
+
+
+def orm_path():
+    """The original listing: hydrate ORM objects, to_dict each and jsonify"""
+    goose_sightings = Sighting.query.join(User).all()
+    body = jsonify({"sightings": [s.to_dict() for s in goose_sightings]}).get_data()
+    db.session.expunge_all()
+    return body
+
+
+def row_path():
+    """The fast listing: select row tuples and encode them directly"""
+    rows = sighting_rows_query().all()
+    return dumps({"sightings": [serialize_sighting_row(row) for row in rows]})
+
+
+def best_of(func, repeat=3):
+    """Best wall-clock time of several runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    app = create_app()
+    with app.app_context(), app.test_request_context():
+        print(f"{'rows':>8} {'orm (s)':>10} {'rows (s)':>10} {'speedup':>8}")
+        for row_count in ROW_COUNTS:
+            seed(row_count)
+            orm_time = best_of(orm_path)
+            row_time = best_of(row_path)
+            print(
+                f"{row_count:>8} {orm_time:>10.3f} {row_time:>10.3f} "
+                f"{orm_time / row_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
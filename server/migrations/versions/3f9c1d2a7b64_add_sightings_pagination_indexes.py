@@ -0,0 +1,28 @@
+"""add sightings pagination indexes
+
+Revision ID: 3f9c1d2a7b64
+Revises: 8e42a7eb2572
+Create Date: 2026-10-18 09:12:41.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9c1d2a7b64'
+down_revision = '8e42a7eb2572'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.create_index('ix_sightings_created_date_id', ['created_date', 'id'], unique=False)
+        batch_op.create_index('ix_sightings_user_id_created_date_id', ['user_id', 'created_date', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.drop_index('ix_sightings_user_id_created_date_id')
+        batch_op.drop_index('ix_sightings_created_date_id')
@@ -0,0 +1,52 @@
+"""add user sighting counters
+
+Revision ID: 4d6b8e2a1f93
+Revises: 9a4f6c1e8d27
+Create Date: 2026-10-18 17:31:44.209183
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4d6b8e2a1f93'
+down_revision = '9a4f6c1e8d27'
+branch_labels = None
+depends_on = None
+
+users = sa.table(
+    'users',
+    sa.column('id'),
+    sa.column('sightings_count', sa.Integer()),
+    sa.column('last_sighting_at', sa.DateTime()),
+)
+sightings = sa.table(
+    'sightings',
+    sa.column('user_id'),
+    sa.column('created_date', sa.DateTime()),
+)
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('sightings_count', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('last_sighting_at', sa.DateTime(), nullable=True))
+
+    # Backfill the counters from the existing sightings
+    op.execute(
+        users.update().values(
+            sightings_count=sa.select(sa.func.count())
+            .where(sightings.c.user_id == users.c.id)
+            .scalar_subquery(),
+            last_sighting_at=sa.select(sa.func.max(sightings.c.created_date))
+            .where(sightings.c.user_id == users.c.id)
+            .scalar_subquery(),
+        )
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('last_sighting_at')
+        batch_op.drop_column('sightings_count')
@@ -0,0 +1,34 @@
+"""add collection versions table
+
+Revision ID: 5b8e3f60ac17
+Revises: c51e08b7d9a2
+Create Date: 2026-10-18 12:41:52.907316
+
+"""
+import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b8e3f60ac17'
+down_revision = 'c51e08b7d9a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    collection_versions = op.create_table('collection_versions',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.bulk_insert(collection_versions, [
+        {'name': 'sightings', 'version': 1, 'updated_at': datetime.datetime.now(datetime.timezone.utc)},
+    ])
+
+
+def downgrade():
+    op.drop_table('collection_versions')
@@ -0,0 +1,60 @@
+"""add sightings full-text search
+
+Revision ID: 7c3d9b2e4f10
+Revises: e2f7a94c1b58
+Create Date: 2026-10-18 15:37:29.044815
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3d9b2e4f10'
+down_revision = 'e2f7a94c1b58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "ALTER TABLE sightings ADD COLUMN search_vector tsvector GENERATED ALWAYS AS "
+            "(to_tsvector('english', coalesce(name, '') || ' ' || coalesce(notes, ''))) STORED"
+        )
+        op.create_index('ix_sightings_search_vector', 'sightings', ['search_vector'], unique=False, postgresql_using='gin')
+    else:
+        op.execute(
+            "CREATE VIRTUAL TABLE sightings_fts USING fts5("
+            "name, notes, content='sightings', content_rowid='rowid')"
+        )
+        op.execute(
+            "CREATE TRIGGER sightings_fts_ai AFTER INSERT ON sightings BEGIN "
+            "INSERT INTO sightings_fts(rowid, name, notes) VALUES (new.rowid, new.name, new.notes); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER sightings_fts_ad AFTER DELETE ON sightings BEGIN "
+            "INSERT INTO sightings_fts(sightings_fts, rowid, name, notes) "
+            "VALUES ('delete', old.rowid, old.name, old.notes); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER sightings_fts_au AFTER UPDATE ON sightings BEGIN "
+            "INSERT INTO sightings_fts(sightings_fts, rowid, name, notes) "
+            "VALUES ('delete', old.rowid, old.name, old.notes); "
+            "INSERT INTO sightings_fts(rowid, name, notes) VALUES (new.rowid, new.name, new.notes); "
+            "END"
+        )
+        op.execute("INSERT INTO sightings_fts(sightings_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_sightings_search_vector', table_name='sightings', postgresql_using='gin')
+        op.drop_column('sightings', 'search_vector')
+    else:
+        op.execute("DROP TRIGGER sightings_fts_au")
+        op.execute("DROP TRIGGER sightings_fts_ad")
+        op.execute("DROP TRIGGER sightings_fts_ai")
+        op.execute("DROP TABLE sightings_fts")
@@ -0,0 +1,57 @@
+"""add sighting activity rollups
+
+Revision ID: 9a4f6c1e8d27
+Revises: 7c3d9b2e4f10
+Create Date: 2026-10-18 16:52:10.385642
+
+"""
+from collections import Counter
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.activity import ROLLUP_BUCKETS, ROLLUP_CELL_ZOOM, bucket_start
+
+
+# revision identifiers, used by Alembic.
+revision = '9a4f6c1e8d27'
+down_revision = '7c3d9b2e4f10'
+branch_labels = None
+depends_on = None
+
+sightings = sa.table(
+    'sightings',
+    sa.column('created_date', sa.DateTime()),
+    sa.column('quadkey', sa.String()),
+)
+
+
+def upgrade():
+    rollups = op.create_table('sighting_activity_rollups',
+    sa.Column('bucket', sa.String(length=8), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('cell', sa.String(length=ROLLUP_CELL_ZOOM), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('bucket', 'bucket_start', 'cell')
+    )
+
+    # Backfill the rollups from the existing sightings
+    counts = Counter()
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(sightings.c.created_date, sightings.c.quadkey)
+        .where(sightings.c.created_date.is_not(None))
+    )
+    for created_date, quadkey in rows:
+        for bucket in ROLLUP_BUCKETS:
+            counts[(bucket, bucket_start(created_date, bucket), quadkey[:ROLLUP_CELL_ZOOM])] += 1
+
+    if counts:
+        op.bulk_insert(rollups, [
+            {'bucket': bucket, 'bucket_start': start, 'cell': cell, 'count': count}
+            for (bucket, start, cell), count in counts.items()
+        ])
+
+
+def downgrade():
+    op.drop_table('sighting_activity_rollups')
@@ -0,0 +1,53 @@
+"""add sighting latitude and longitude columns
+
+Revision ID: a7d24e915c03
+Revises: 3f9c1d2a7b64
+Create Date: 2026-10-18 10:03:17.542981
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d24e915c03'
+down_revision = '3f9c1d2a7b64'
+branch_labels = None
+depends_on = None
+
+sightings = sa.table(
+    'sightings',
+    sa.column('id', sa.UUID()),
+    sa.column('coords', sa.String()),
+    sa.column('latitude', sa.Float()),
+    sa.column('longitude', sa.Float()),
+)
+
+
+def upgrade():
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('latitude', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('longitude', sa.Float(), nullable=True))
+
+    # Backfill from the already validated "lat,lng" coords strings
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(sightings.c.id, sightings.c.coords)).fetchall()
+    for sighting_id, coords in rows:
+        lat_str, lng_str = coords.split(",")
+        connection.execute(
+            sightings.update()
+            .where(sightings.c.id == sighting_id)
+            .values(latitude=float(lat_str.strip()), longitude=float(lng_str.strip()))
+        )
+
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.alter_column('latitude', existing_type=sa.Float(), nullable=False)
+        batch_op.alter_column('longitude', existing_type=sa.Float(), nullable=False)
+        batch_op.create_index('ix_sightings_latitude_longitude', ['latitude', 'longitude'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.drop_index('ix_sightings_latitude_longitude')
+        batch_op.drop_column('longitude')
+        batch_op.drop_column('latitude')
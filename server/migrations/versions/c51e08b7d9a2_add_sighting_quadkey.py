@@ -0,0 +1,52 @@
+"""add sighting quadkey
+
+Revision ID: c51e08b7d9a2
+Revises: a7d24e915c03
+Create Date: 2026-10-18 11:26:05.310447
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.tiles.quadkey import QUADKEY_ZOOM, latlng_to_quadkey
+
+
+# revision identifiers, used by Alembic.
+revision = 'c51e08b7d9a2'
+down_revision = 'a7d24e915c03'
+branch_labels = None
+depends_on = None
+
+sightings = sa.table(
+    'sightings',
+    sa.column('id', sa.UUID()),
+    sa.column('latitude', sa.Float()),
+    sa.column('longitude', sa.Float()),
+    sa.column('quadkey', sa.String()),
+)
+
+
+def upgrade():
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('quadkey', sa.String(length=QUADKEY_ZOOM), nullable=True))
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(sightings.c.id, sightings.c.latitude, sightings.c.longitude)
+    ).fetchall()
+    for sighting_id, lat, lng in rows:
+        connection.execute(
+            sightings.update()
+            .where(sightings.c.id == sighting_id)
+            .values(quadkey=latlng_to_quadkey(lat, lng))
+        )
+
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.alter_column('quadkey', existing_type=sa.String(length=QUADKEY_ZOOM), nullable=False)
+        batch_op.create_index(batch_op.f('ix_sightings_quadkey'), ['quadkey'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_sightings_quadkey'))
+        batch_op.drop_column('quadkey')
@@ -0,0 +1,49 @@
+"""add sighting updated_at and tombstones
+
+Revision ID: e2f7a94c1b58
+Revises: 5b8e3f60ac17
+Create Date: 2026-10-18 14:08:33.671920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2f7a94c1b58'
+down_revision = '5b8e3f60ac17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    op.execute(
+        "UPDATE sightings SET updated_at = COALESCE(created_date, CURRENT_TIMESTAMP)"
+    )
+
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index('ix_sightings_updated_at_id', ['updated_at', 'id'], unique=False)
+
+    op.create_table('sighting_tombstones',
+    sa.Column('sighting_id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('sighting_id')
+    )
+    with op.batch_alter_table('sighting_tombstones', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_sighting_tombstones_deleted_at'), ['deleted_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('sighting_tombstones', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_sighting_tombstones_deleted_at'))
+
+    op.drop_table('sighting_tombstones')
+
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.drop_index('ix_sightings_updated_at_id')
+        batch_op.drop_column('updated_at')
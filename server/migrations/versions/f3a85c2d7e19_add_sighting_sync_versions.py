@@ -0,0 +1,38 @@
+"""add sighting sync versions
+
+Revision ID: f3a85c2d7e19
+Revises: b83e1f5c2d46
+Create Date: 2026-10-18 21:37:52.208416
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a85c2d7e19'
+down_revision = 'b83e1f5c2d46'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows start at version 0; clients holding a timestamp sync token
+    # catch up on them through the updated_at filter once
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('sync_version', sa.Integer(), server_default='0', nullable=False))
+        batch_op.create_index('ix_sightings_sync_version_id', ['sync_version', 'id'], unique=False)
+
+    with op.batch_alter_table('sighting_tombstones', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('sync_version', sa.Integer(), server_default='0', nullable=False))
+        batch_op.create_index(batch_op.f('ix_sighting_tombstones_sync_version'), ['sync_version'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('sighting_tombstones', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_sighting_tombstones_sync_version'))
+        batch_op.drop_column('sync_version')
+
+    with op.batch_alter_table('sightings', schema=None) as batch_op:
+        batch_op.drop_index('ix_sightings_sync_version_id')
+        batch_op.drop_column('sync_version')
@@ -2,7 +2,7 @@ import sys
 import os
 import pytest
 import requests
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 # Add the parent directory to sys.path
@@ -92,3 +92,18 @@ def auth_headers(client):
         "Authorization": f"Bearer {access_token}",
         "Content-Type": "application/json",
     }
+
+
+@pytest.fixture
+def count_queries(client):
+    """Count the SQL statements executed by the test database engine."""
+    from app import db
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
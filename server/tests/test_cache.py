@@ -0,0 +1,132 @@
+import pytest
+
+from app.cache.backends import MemoryBackend, RedisBackend
+
+
+class FakeRedis:
+    """Local stand-in for the subset of the redis-py client the cache uses."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def shared_cache_client(request, client):
+    """A client whose app uses either the in-process or the shared cache backend."""
+    if request.param == "redis":
+        client.application.extensions["response_cache"] = RedisBackend(FakeRedis())
+    return client
+
+
+def test_memory_backend_lru_eviction():
+    backend = MemoryBackend(max_entries=2)
+    backend.set("a", b"1", ttl=60)
+    backend.set("b", b"2", ttl=60)
+    backend.get("a")
+    backend.set("c", b"3", ttl=60)
+    assert backend.get("a") == b"1"
+    assert backend.get("b") is None
+    assert backend.get("c") == b"3"
+
+
+def test_memory_backend_ttl():
+    backend = MemoryBackend()
+    backend.set("a", b"1", ttl=0)
+    assert backend.get("a") is None
+
+
+def submit(client, auth_headers, coords):
+    data = {"name": "cached goose", "notes": "", "coords": coords, "image": ""}
+    response = client.post("/api/submit-sighting", headers=auth_headers, json=data)
+    assert response.status_code == 201
+
+
+def test_listing_served_from_cache(shared_cache_client, count_queries):
+    client = shared_cache_client
+    first = client.get("/api/sightings")
+    count_queries.clear()
+    second = client.get("/api/sightings")
+    assert second.get_data() == first.get_data()
+    # The collection version comes from the cache too
+    assert len(count_queries) == 0
+
+
+def test_write_flushes_all_listings(shared_cache_client, auth_headers, count_queries):
+    client = shared_cache_client
+    kw_bbox = "43,-81,44,-80"
+    far_bbox = "10,10,11,11"
+    etag = client.get(f"/api/sightings?bbox={kw_bbox}").headers["ETag"]
+    client.get(f"/api/sightings?bbox={far_bbox}")
+
+    submit(client, auth_headers, "43.4647,-80.5281")
+
+    count_queries.clear()
+    response = client.get(f"/api/sightings?bbox={far_bbox}")
+    assert response.headers["ETag"] != etag
+    assert len(count_queries) > 0
+
+    response = client.get(f"/api/sightings?bbox={kw_bbox}")
+    assert [s["name"] for s in response.json["sightings"]] == ["cached goose"]
+
+
+def test_profile_update_invalidates_user_keys(shared_cache_client, auth_headers):
+    client = shared_cache_client
+    client.get("/api/sightings")
+    client.post("/api/update-profile", headers=auth_headers, json={"description": "new"})
+
+    response = client.get("/api/sightings")
+    assert response.json["sightings"][0]["user"]["description"] == "new"
+
+
+def test_write_on_another_worker_bypasses_cache(shared_cache_client, auth_headers):
+    from app import db
+    from app.main.conditional import forget_collection_version
+    from app.models.collection_version import CollectionVersion
+    from app.models.sightings import Sighting
+    from app.models.user import User
+
+    client = shared_cache_client
+    shared = isinstance(client.application.extensions["response_cache"], RedisBackend)
+    if not shared:
+        # This worker cannot see the write in its own cache, only once the version expires
+        client.application.config["CACHE_VERSION_TTL"] = 0
+    first = client.get("/api/sightings")
+
+    # Another worker commits a sighting and clears the version in the shared cache
+    user = User.query.filter_by(email="test@test.com").first()
+    db.session.add(
+        Sighting(name="other worker goose", notes="", coords="43.46,-80.52", image="", user_id=user.id)
+    )
+    CollectionVersion.bump("sightings")
+    db.session.commit()
+    if shared:
+        forget_collection_version("sightings")
+
+    second = client.get("/api/sightings")
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert len(second.json["sightings"]) == len(first.json["sightings"]) + 1
+
+
+def test_user_id_spellings_share_cache_entry(shared_cache_client, count_queries):
+    import uuid
+
+    from app.models.user import User
+
+    client = shared_cache_client
+    user_id = str(User.query.filter_by(email="test@test.com").first().id)
+    first = client.get(f"/api/sightings?user_id={uuid.UUID(user_id).hex}")
+
+    count_queries.clear()
+    second = client.get(f"/api/sightings?user_id={user_id.upper()}")
+    assert second.get_data() == first.get_data()
+    assert len(count_queries) == 0
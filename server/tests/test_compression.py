@@ -0,0 +1,96 @@
+import gzip
+import json
+
+import brotli
+import pytest
+
+
+@pytest.fixture
+def many_sightings(client, auth_headers):
+    """Enough sightings for the listing to pass the compression threshold."""
+    batch = [
+        {"name": f"goose {i}", "notes": "honk " * 20, "coords": "43.46,-80.52", "image": ""}
+        for i in range(20)
+    ]
+    response = client.post("/api/submit-sightings", headers=auth_headers, json=batch)
+    assert response.status_code == 201
+
+
+def test_listing_gzip(client, many_sightings):
+    response = client.get("/api/sightings", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    data = json.loads(gzip.decompress(response.get_data()))
+    assert len(data["sightings"]) == 21
+
+
+def test_listing_prefers_brotli(client, many_sightings):
+    response = client.get("/api/sightings", headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["Content-Encoding"] == "br"
+    data = json.loads(brotli.decompress(response.get_data()))
+    assert len(data["sightings"]) == 21
+
+
+def test_listing_identity_without_accept_encoding(client, many_sightings):
+    response = client.get("/api/sightings")
+    assert "Content-Encoding" not in response.headers
+    assert len(response.json["sightings"]) == 21
+
+
+def test_listing_below_threshold_not_compressed(client):
+    response = client.get("/api/sightings", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert len(response.json["sightings"]) == 1
+
+
+def test_listing_etag_weak_across_encodings(client, many_sightings):
+    compressed = client.get("/api/sightings", headers={"Accept-Encoding": "gzip"})
+    identity = client.get("/api/sightings")
+    assert compressed.headers["ETag"].startswith("W/")
+    assert compressed.headers["ETag"] == identity.headers["ETag"]
+
+    response = client.get(
+        "/api/sightings",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": identity.headers["ETag"]},
+    )
+    assert response.status_code == 304
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_cached_listing_serves_stored_variant(client, many_sightings, monkeypatch):
+    first = client.get("/api/sightings", headers={"Accept-Encoding": "gzip"})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache hit recompressed the body")
+
+    monkeypatch.setattr("app.main.compression.compress", fail)
+    monkeypatch.setattr("gzip.compress", fail)
+    second = client.get("/api/sightings", headers={"Accept-Encoding": "gzip"})
+    assert second.headers["Content-Encoding"] == "gzip"
+    assert second.get_data() == first.get_data()
+
+    # The identity body is cached alongside it
+    assert len(client.get("/api/sightings").json["sightings"]) == 21
+
+
+def test_compressed_variant_invalidated(client, auth_headers, many_sightings):
+    client.get("/api/sightings", headers={"Accept-Encoding": "br"})
+    data = {"name": "new goose", "notes": "", "coords": "43.46,-80.52", "image": ""}
+    client.post("/api/submit-sighting", headers=auth_headers, json=data)
+
+    response = client.get("/api/sightings", headers={"Accept-Encoding": "br"})
+    data = json.loads(brotli.decompress(response.get_data()))
+    assert len(data["sightings"]) == 22
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+def test_export_gzip_stream(client, export_format):
+    response = client.get(
+        f"/api/sightings/export?format={export_format}",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    body = gzip.decompress(response.get_data()).decode()
+    assert "Test Goose Location" in body
@@ -0,0 +1,394 @@
+import datetime
+import hashlib
+import io
+import os
+import re
+import uuid
+
+import pytest
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
+
+
+class FakeS3:
+    """Local stand-in for the subset of the boto3 S3 client get_image uses."""
+
+    def __init__(self, body, objects=None):
+        self.body = body
+        self.objects = objects if objects is not None else {}
+        self.requests = []
+        self.presigned = []
+
+    def get_object(self, Bucket, Key, Range=None, IfNoneMatch=None):
+        self.requests.append(Range)
+        if Key.startswith("uploads/") and Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        data, content_range = self.objects.get(Key, self.body), None
+        etag = f'"{hashlib.md5(data).hexdigest()}"'
+        if IfNoneMatch == etag:
+            raise ClientError({"Error": {"Code": "304"}}, "GetObject")
+        if Range:
+            start, end = re.fullmatch(r"bytes=(\d*)-(\d*)", Range).groups()
+            size = len(self.body)
+            if not start:
+                start, end = size - int(end), size - 1
+            else:
+                start, end = int(start), min(int(end or size - 1), size - 1)
+            if start >= size:
+                raise ClientError({"Error": {"Code": "InvalidRange"}}, "GetObject")
+            data = self.body[start : end + 1]
+            content_range = f"bytes {start}-{end}/{size}"
+
+        response = {
+            "Body": StreamingBody(io.BytesIO(data), len(data)),
+            "ContentLength": len(data),
+            "ETag": etag,
+            "LastModified": datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc),
+        }
+        if content_range:
+            response["ContentRange"] = content_range
+        return response
+
+    def upload_fileobj(self, fileobj, Bucket, Key, ExtraArgs=None):
+        self.objects[Key] = fileobj.read()
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+    def generate_presigned_url(self, ClientMethod, Params, ExpiresIn):
+        self.presigned.append(Params["Key"])
+        return f"https://{Params['Bucket']}.s3.amazonaws.com/{Params['Key']}?X-Amz-Expires={ExpiresIn}"
+
+    def generate_presigned_post(self, Bucket, Key, Conditions=None, ExpiresIn=None):
+        return {
+            "url": f"https://{Bucket}.s3.amazonaws.com/",
+            "fields": {"key": Key, "policy": "policy", "x-amz-signature": "signature"},
+        }
+
+
+@pytest.fixture
+def stored_image(client, monkeypatch):
+    from app import db
+    from app.models.images import Image
+
+    image_id = uuid.uuid4()
+    image = Image(
+        id=image_id,
+        s3_url=f"https://honk-spotter.s3.amazonaws.com/images/{image_id}.png",
+    )
+    db.session.add(image)
+    db.session.commit()
+    monkeypatch.setattr("app.image.routes.get_client", lambda: FakeS3(b"honk"))
+    return str(image.id)
+
+
+@pytest.fixture
+def large_image(client, stored_image, monkeypatch):
+    s3 = FakeS3(bytes(range(256)) * 1024)
+    monkeypatch.setattr("app.image.routes.get_client", lambda: s3)
+    return stored_image, s3
+
+
+def test_get_image(client, stored_image):
+    response = client.get(f"/api/image/{stored_image}")
+    assert response.status_code == 200
+    assert response.mimetype == "image/png"
+    assert response.get_data() == b"honk"
+
+
+def test_get_image_streams_in_chunks(client, large_image):
+    image_id, s3 = large_image
+    response = client.get(f"/api/image/{image_id}", buffered=False)
+    assert response.status_code == 200
+    assert response.headers["Content-Length"] == str(len(s3.body))
+    assert response.headers["Accept-Ranges"] == "bytes"
+
+    chunk_size = client.application.config["IMAGE_STREAM_CHUNK_SIZE"]
+    chunks = list(response.response)
+    assert max(len(chunk) for chunk in chunks) <= chunk_size
+    assert b"".join(chunks) == s3.body
+
+
+def test_get_image_range(client, large_image):
+    image_id, s3 = large_image
+    response = client.get(f"/api/image/{image_id}", headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == f"bytes 10-19/{len(s3.body)}"
+    assert response.headers["Content-Length"] == "10"
+    assert response.get_data() == s3.body[10:20]
+
+    response = client.get(f"/api/image/{image_id}", headers={"Range": "bytes=-5"})
+    assert response.status_code == 206
+    assert response.get_data() == s3.body[-5:]
+
+
+def test_get_image_unsatisfiable_range(client, large_image):
+    image_id, s3 = large_image
+    response = client.get(
+        f"/api/image/{image_id}", headers={"Range": f"bytes={len(s3.body)}-"}
+    )
+    assert response.status_code == 416
+
+
+def test_get_image_multiple_ranges_served_whole(client, large_image):
+    image_id, s3 = large_image
+    response = client.get(f"/api/image/{image_id}", headers={"Range": "bytes=0-1,5-6"})
+    assert response.status_code == 200
+    assert s3.requests == [None]
+    assert response.get_data() == s3.body
+
+
+def test_get_image_not_found(client, stored_image):
+    response = client.get(f"/api/image/{uuid.uuid4()}")
+    assert response.status_code == 404
+
+
+def test_get_image_query_count(client, stored_image, count_queries):
+    count_queries.clear()
+    client.get(f"/api/image/{stored_image}")
+    assert len(count_queries) == 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_secret_cache_refreshes_before_expiry():
+    from app.image.s3 import SecretCache
+
+    clock = FakeClock()
+    values = iter(["first", "second"])
+    cache = SecretCache(lambda: next(values), ttl=100, refresh_margin=10, clock=clock)
+
+    assert cache.get() == "first"
+    clock.now = 89
+    assert cache.get() == "first"
+    clock.now = 91
+    assert cache.get() == "second"
+
+
+def test_secret_cache_keeps_value_when_refresh_fails():
+    from app.image.s3 import SecretCache
+
+    clock = FakeClock()
+    calls = []
+
+    def fetch():
+        calls.append(clock.now)
+        if len(calls) > 1:
+            raise RuntimeError("secrets manager unavailable")
+        return "secret"
+
+    cache = SecretCache(fetch, ttl=100, refresh_margin=10, clock=clock)
+    assert cache.get() == "secret"
+    clock.now = 95
+    assert cache.get() == "secret"
+    clock.now = 101
+    with pytest.raises(RuntimeError):
+        cache.get()
+
+
+def test_get_client_is_shared(client, monkeypatch):
+    from app.image.s3 import get_client
+
+    monkeypatch.setenv("S3_SECRET_KEY", "local-secret")
+    with client.application.app_context():
+        s3_client = get_client()
+        assert get_client() is s3_client
+        assert s3_client.meta.config.max_pool_connections == (
+            client.application.config["S3_MAX_POOL_CONNECTIONS"]
+        )
+        assert s3_client.meta.config.tcp_keepalive is True
+
+
+def test_get_image_redirect_mode(client, stored_image, monkeypatch):
+    s3 = FakeS3(b"honk")
+    monkeypatch.setattr("app.image.s3.get_client", lambda: s3)
+    client.application.config["IMAGE_DELIVERY_MODE"] = "redirect"
+
+    first = client.get(f"/api/image/{stored_image}")
+    assert first.status_code == 302
+    assert first.headers["Location"].startswith(
+        f"https://honk-spotter.s3.amazonaws.com/images/{stored_image}.png?"
+    )
+    assert "private" in first.headers["Cache-Control"]
+
+    second = client.get(f"/api/image/{stored_image}")
+    assert second.headers["Location"] == first.headers["Location"]
+    # Presigned once, then served from the cache; the object is never proxied
+    assert len(s3.presigned) == 1
+    assert s3.requests == []
+
+
+@pytest.fixture
+def upload_s3(monkeypatch):
+    s3 = FakeS3(b"")
+    monkeypatch.setattr("app.image.routes.get_client", lambda: s3)
+    return s3
+
+
+def png_bytes():
+    from PIL import Image as PILImage
+
+    data = io.BytesIO()
+    PILImage.new("RGBA", (4, 4), (255, 0, 0, 128)).save(data, format="PNG")
+    return data.getvalue()
+
+
+def test_presigned_upload_flow(client, auth_headers, upload_s3):
+    from app import db
+    from app.models.images import Image
+
+    response = client.post("/api/image-upload/presign", headers=auth_headers)
+    assert response.status_code == 201
+    image_id = response.json["id"]
+    assert response.json["fields"]["key"] == f"uploads/{image_id}"
+
+    # The client uploads straight to the bucket
+    upload_s3.objects[f"uploads/{image_id}"] = png_bytes()
+
+    response = client.post(f"/api/image-upload/{image_id}/finalize", headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json["id"] == image_id
+    assert f"images/{image_id}.png" in upload_s3.objects
+    assert f"uploads/{image_id}" not in upload_s3.objects
+    image = db.session.get(Image, uuid.UUID(image_id))
+    stored = upload_s3.objects[f"images/{image_id}.png"]
+    assert image.content_hash == hashlib.sha256(stored).hexdigest()
+
+    response = client.post(f"/api/image-upload/{image_id}/finalize", headers=auth_headers)
+    assert response.status_code == 409
+
+
+def test_finalize_rejects_non_image(client, auth_headers, upload_s3):
+    image_id = str(uuid.uuid4())
+    upload_s3.objects[f"uploads/{image_id}"] = b"not an image"
+
+    response = client.post(f"/api/image-upload/{image_id}/finalize", headers=auth_headers)
+    assert response.status_code == 400
+    assert upload_s3.objects == {}
+
+
+def test_finalize_missing_upload(client, auth_headers, upload_s3):
+    response = client.post(
+        f"/api/image-upload/{uuid.uuid4()}/finalize", headers=auth_headers
+    )
+    assert response.status_code == 404
+
+
+@pytest.fixture
+def disk_cached_image(client, large_image, tmp_path):
+    client.application.config["IMAGE_DISK_CACHE_DIR"] = str(tmp_path)
+    return large_image
+
+
+def test_get_image_disk_cache(client, disk_cached_image, tmp_path):
+    image_id, s3 = disk_cached_image
+    first = client.get(f"/api/image/{image_id}")
+    assert first.get_data() == s3.body
+    assert (tmp_path / image_id).read_bytes() == s3.body
+
+    second = client.get(f"/api/image/{image_id}")
+    assert second.status_code == 200
+    assert second.get_data() == s3.body
+    assert second.mimetype == "image/png"
+    assert len(s3.requests) == 1
+
+    partial = client.get(f"/api/image/{image_id}", headers={"Range": "bytes=0-9"})
+    assert partial.status_code == 206
+    assert partial.get_data() == s3.body[:10]
+    assert len(s3.requests) == 1
+
+
+def test_get_image_range_not_disk_cached(client, disk_cached_image, tmp_path):
+    image_id, s3 = disk_cached_image
+    client.get(f"/api/image/{image_id}", headers={"Range": "bytes=0-9"})
+    assert not (tmp_path / image_id).exists()
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    from app.image.disk_cache import DiskCache
+
+    cache = DiskCache(str(tmp_path), max_bytes=25)
+    list(cache.fill("a", [b"a" * 10]))
+    list(cache.fill("b", [b"b" * 10]))
+    os.utime(tmp_path / "a", (1, os.stat(tmp_path / "a").st_mtime))
+    os.utime(tmp_path / "b", (2, os.stat(tmp_path / "b").st_mtime))
+    assert cache.get("a")  # now the most recently used
+
+    list(cache.fill("c", [b"c" * 10]))
+    assert cache.get("a") and cache.get("c")
+    assert cache.get("b") is None
+
+
+def test_disk_cache_discards_incomplete_fill(tmp_path):
+    from app.image.disk_cache import DiskCache
+
+    cache = DiskCache(str(tmp_path), max_bytes=100)
+    stream = cache.fill("a", iter([b"first", b"second"]))
+    assert next(stream) == b"first"
+    stream.close()
+
+    assert cache.get("a") is None
+    assert [p.name for p in tmp_path.iterdir() if not p.name.startswith(".lock")] == []
+
+
+@pytest.fixture
+def hashed_image(client, stored_image):
+    from app import db
+    from app.models.images import Image
+
+    image = db.session.get(Image, uuid.UUID(stored_image))
+    image.content_hash = hashlib.sha256(b"honk").hexdigest()
+    db.session.commit()
+    return stored_image, image.content_hash
+
+
+def test_get_image_immutable_headers(client, hashed_image):
+    image_id, content_hash = hashed_image
+    response = client.get(f"/api/image/{image_id}")
+    assert response.status_code == 200
+    assert response.headers["ETag"] == f'"{content_hash}"'
+    assert response.cache_control.public
+    assert response.cache_control.immutable
+    assert response.cache_control.max_age == 31536000
+    assert response.last_modified is not None
+
+
+def test_get_image_not_modified_without_s3(client, hashed_image, monkeypatch):
+    image_id, content_hash = hashed_image
+
+    def no_s3():
+        raise AssertionError("S3 was called for a conditional request")
+
+    monkeypatch.setattr("app.image.routes.get_client", no_s3)
+    response = client.get(
+        f"/api/image/{image_id}", headers={"If-None-Match": f'"{content_hash}"'}
+    )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == f'"{content_hash}"'
+    assert response.cache_control.immutable
+
+
+def test_get_image_not_modified_legacy_image(client, stored_image):
+    first = client.get(f"/api/image/{stored_image}")
+    assert first.headers["ETag"] == f'"{hashlib.md5(b"honk").hexdigest()}"'
+
+    response = client.get(
+        f"/api/image/{stored_image}", headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert response.status_code == 304
+
+
+def test_disk_cached_image_uses_content_hash_etag(client, hashed_image, tmp_path):
+    image_id, content_hash = hashed_image
+    client.application.config["IMAGE_DISK_CACHE_DIR"] = str(tmp_path)
+    client.get(f"/api/image/{image_id}")
+
+    response = client.get(f"/api/image/{image_id}")
+    assert response.headers["ETag"] == f'"{content_hash}"'
+    assert response.cache_control.immutable
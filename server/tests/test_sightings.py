@@ -1,3 +1,4 @@
+import datetime
 import pytest
 import uuid
 
@@ -42,3 +43,467 @@ def test_get_sightings(client):
     sighting = data.get("sightings")
     assert response.status_code == 200
     assert len(sighting) > 0
+
+
+def test_get_sightings_paginated(client, auth_headers):
+    for i in range(4):
+        data = {
+            "name": f"goose page {i}",
+            "notes": "i am a note",
+            "coords": "34.0522,-118.2437",
+            "image": "",
+        }
+        client.post("/api/submit-sighting", headers=auth_headers, json=data)
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/sightings?limit=2" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url)
+        assert response.status_code == 200
+        page = response.json["sightings"]
+        assert len(page) <= 2
+        seen.extend(page)
+        cursor = response.json["next_cursor"]
+        if not cursor:
+            break
+
+    ids = [sighting["id"] for sighting in seen]
+    assert len(ids) == len(set(ids)) == 5
+    dates = [sighting["created_date"] for sighting in seen]
+    assert dates == sorted(dates, reverse=True)
+
+
+def test_get_sightings_invalid_cursor(client):
+    response = client.get("/api/sightings?cursor=not-a-cursor")
+    assert response.status_code == 400
+    assert response.json["error"] == "Invalid cursor"
+
+
+def test_get_sightings_invalid_limit(client):
+    response = client.get("/api/sightings?limit=-1")
+    assert response.status_code == 400
+
+
+def test_get_sightings_bbox(client, auth_headers):
+    data = {
+        "name": "waterloo park goose",
+        "notes": "i am a note",
+        "coords": "43.4647, -80.5281",
+        "image": "",
+    }
+    client.post("/api/submit-sighting", headers=auth_headers, json=data)
+
+    response = client.get("/api/sightings?bbox=43.4,-80.6,43.5,-80.4")
+    assert response.status_code == 200
+    sightings = response.json["sightings"]
+    assert [s["name"] for s in sightings] == ["waterloo park goose"]
+    assert sightings[0]["coords"] == {"lat": 43.4647, "lng": -80.5281}
+
+
+def test_get_sightings_invalid_bbox(client):
+    response = client.get("/api/sightings?bbox=1,2,3")
+    assert response.status_code == 400
+    assert response.json["error"] == "Invalid bbox format"
+
+
+def test_get_sighting_clusters(client, auth_headers):
+    for coords in ["43.4647,-80.5281", "43.4649,-80.5225", "43.4259,-80.4369"]:
+        data = {"name": "kw goose", "notes": "", "coords": coords, "image": ""}
+        client.post("/api/submit-sighting", headers=auth_headers, json=data)
+
+    response = client.get("/api/sightings/clusters?bbox=43,-81,44,-80&zoom=2")
+    assert response.status_code == 200
+    assert response.json["clustered"] is True
+    clusters = response.json["clusters"]
+    assert len(clusters) == 1
+    assert clusters[0]["count"] == 3
+
+    response = client.get("/api/sightings/clusters?bbox=43,-81,44,-80&zoom=18")
+    assert response.status_code == 200
+    assert response.json["clustered"] is False
+    assert len(response.json["sightings"]) == 3
+
+    response = client.get("/api/sightings/clusters?zoom=18")
+    assert response.status_code == 400
+
+
+def test_get_sighting_clusters_invalid_zoom(client):
+    response = client.get("/api/sightings/clusters?zoom=abc")
+    assert response.status_code == 400
+
+
+def add_sightings_for_new_users(count):
+    """Insert sightings that each belong to a different user."""
+    from app.models.user import User
+    from app.models.sightings import Sighting
+    from app.main.conditional import forget_collection_version
+    from app.models.collection_version import CollectionVersion
+    from app import db
+
+    sightings = []
+    for _ in range(count):
+        user = User(email=f"{uuid.uuid4()}@test.com", password="unused")
+        db.session.add(user)
+        sightings.append(
+            Sighting(name="goose", notes="", coords="43.46,-80.52", user=user)
+        )
+    db.session.add_all(sightings)
+    CollectionVersion.bump("sightings")
+    db.session.commit()
+    forget_collection_version("sightings")
+    db.session.expunge_all()
+
+
+def test_get_sightings_query_count_is_constant(client, count_queries):
+    add_sightings_for_new_users(2)
+    count_queries.clear()
+    response = client.get("/api/sightings")
+    assert response.status_code == 200
+    few_rows_queries = len(count_queries)
+
+    add_sightings_for_new_users(20)
+    count_queries.clear()
+    response = client.get("/api/sightings")
+    assert response.status_code == 200
+    assert len(response.json["sightings"]) == 23
+    assert all(s["user"] is not None for s in response.json["sightings"])
+    assert len(count_queries) == few_rows_queries
+
+
+def test_listing_matches_to_dict(client):
+    from app.models.sightings import Sighting
+
+    expected = Sighting.query.first().to_dict()
+    response = client.get("/api/sightings")
+    assert response.json["sightings"] == [expected]
+
+
+def test_dumps_stdlib_fallback(client, monkeypatch):
+    import json
+    from app.main import serializers
+    from app.main.serializers import serialize_sighting_row, sighting_rows_query
+
+    row = sighting_rows_query().first()
+    fast = json.loads(serializers.dumps(serialize_sighting_row(row)))
+    monkeypatch.setattr(serializers, "orjson", None)
+    fallback = json.loads(serializers.dumps(serialize_sighting_row(row)))
+    assert fast == fallback
+
+
+def test_get_sightings_conditional(client, auth_headers):
+    response = client.get("/api/sightings")
+    etag = response.headers["ETag"]
+    last_modified = response.headers.get("Last-Modified")
+
+    response = client.get("/api/sightings", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    data = {"name": "new goose", "notes": "", "coords": "43.4647,-80.5281", "image": ""}
+    client.post("/api/submit-sighting", headers=auth_headers, json=data)
+
+    response = client.get("/api/sightings", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    last_modified = response.headers["Last-Modified"]
+    response = client.get("/api/sightings", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+
+def test_get_sightings_conditional_profile_update(client, auth_headers):
+    etag = client.get("/api/sightings").headers["ETag"]
+    client.post("/api/update-profile", headers=auth_headers, json={"description": "hi"})
+
+    response = client.get("/api/sightings", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+def test_sync_sightings_since(client, auth_headers):
+    response = client.get("/api/sightings?since=2000-01-01T00:00:00")
+    assert response.status_code == 200
+    assert len(response.json["sightings"]) == 1
+    assert response.json["has_more"] is False
+    since = response.json["next_since"]
+
+    response = client.get(f"/api/sightings?since={since}")
+    assert response.json["sightings"] == []
+    assert response.json["deleted"] == []
+
+    data = {"name": "synced goose", "notes": "", "coords": "43.4647,-80.5281", "image": ""}
+    new_id = client.post(
+        "/api/submit-sighting", headers=auth_headers, json=data
+    ).json["sighting"]["id"]
+
+    response = client.get(f"/api/sightings?since={since}")
+    assert [s["id"] for s in response.json["sightings"]] == [new_id]
+    since = response.json["next_since"]
+
+    response = client.delete(f"/api/sightings/{new_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    response = client.get(f"/api/sightings?since={since}")
+    assert response.json["sightings"] == []
+    assert response.json["deleted"] == [new_id]
+
+
+def test_sync_sightings_since_for_user(client, auth_headers):
+    user_id = client.get("/api/sightings").json["sightings"][0]["user"]["id"]
+    data = {"name": "synced goose", "notes": "", "coords": "43.4647,-80.5281", "image": ""}
+    new_id = client.post(
+        "/api/submit-sighting", headers=auth_headers, json=data
+    ).json["sighting"]["id"]
+    client.delete(f"/api/sightings/{new_id}", headers=auth_headers)
+
+    response = client.get(f"/api/sightings?since=2000-01-01T00:00:00&user_id={user_id}")
+    assert response.status_code == 200
+    assert len(response.json["sightings"]) == 1
+    assert response.json["deleted"] == [new_id]
+
+
+def test_sync_sightings_batches(client, auth_headers):
+    for i in range(3):
+        data = {"name": f"goose {i}", "notes": "", "coords": "43.46,-80.52", "image": ""}
+        client.post("/api/submit-sighting", headers=auth_headers, json=data)
+
+    seen = []
+    since = "2000-01-01T00:00:00"
+    while True:
+        response = client.get(f"/api/sightings?since={since}&limit=2")
+        seen.extend(s["id"] for s in response.json["sightings"])
+        since = response.json["next_since"]
+        if not response.json["has_more"]:
+            break
+
+    assert len(seen) == len(set(seen)) == 4
+
+
+def test_sync_sightings_follows_commit_order(client, auth_headers):
+    from app import db
+    from app.models.sightings import Sighting
+
+    since = client.get("/api/sightings?since=2000-01-01T00:00:00").json["next_since"]
+
+    # A write stamped before the last sync but committed after it
+    data = {"name": "late goose", "notes": "", "coords": "43.4647,-80.5281", "image": ""}
+    new_id = client.post(
+        "/api/submit-sighting", headers=auth_headers, json=data
+    ).json["sighting"]["id"]
+    db.session.get(Sighting, uuid.UUID(new_id)).updated_at = datetime.datetime(2001, 1, 1)
+    db.session.commit()
+
+    response = client.get(f"/api/sightings?since={since}")
+    assert [s["id"] for s in response.json["sightings"]] == [new_id]
+
+
+def test_sync_sightings_invalid_since(client):
+    response = client.get("/api/sightings?since=yesterday")
+    assert response.status_code == 400
+
+
+def test_delete_sighting_not_found(client, auth_headers):
+    response = client.delete(f"/api/sightings/{uuid.uuid4()}", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_export_sightings_ndjson(client, auth_headers):
+    import json
+
+    data = {"name": "export goose", "notes": "", "coords": "43.46,-80.52", "image": ""}
+    client.post("/api/submit-sighting", headers=auth_headers, json=data)
+
+    response = client.get("/api/sightings/export")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    exported = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    listed = client.get("/api/sightings").json["sightings"]
+    assert sorted(exported, key=lambda s: s["id"]) == sorted(listed, key=lambda s: s["id"])
+
+
+def test_export_sightings_csv(client):
+    import csv
+    import io
+
+    response = client.get("/api/sightings/export?format=csv")
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert len(rows) == 1
+    assert rows[0]["name"] == "Test Goose Location"
+    assert float(rows[0]["lat"]) == 34.0522
+
+
+def test_export_sightings_invalid_format(client):
+    response = client.get("/api/sightings/export?format=xml")
+    assert response.status_code == 400
+
+
+def test_submit_sightings_batch(client, auth_headers, count_queries):
+    batch = [
+        {"name": f"batch goose {i}", "notes": "", "coords": "43.46,-80.52", "image": ""}
+        for i in range(5)
+    ]
+    batch.insert(2, {"name": "bad goose", "notes": "", "coords": "3 3", "image": ""})
+
+    count_queries.clear()
+    response = client.post("/api/submit-sightings", headers=auth_headers, json=batch)
+    assert response.status_code == 207
+    results = response.json["results"]
+    assert [r["status"] for r in results] == [201, 201, 400, 201, 201, 201]
+    assert results[0]["sighting"]["name"] == "batch goose 0"
+    inserts = [q for q in count_queries if q.lstrip().upper().startswith("INSERT INTO SIGHTINGS")]
+    assert len(inserts) == 1
+
+    response = client.get("/api/sightings")
+    assert len(response.json["sightings"]) == 6
+
+
+def test_submit_sightings_batch_all_invalid(client, auth_headers):
+    batch = [{"name": "", "notes": "", "coords": "43.46,-80.52", "image": ""}]
+    response = client.post("/api/submit-sightings", headers=auth_headers, json=batch)
+    assert response.status_code == 400
+
+
+def test_submit_sightings_batch_not_array(client, auth_headers):
+    response = client.post("/api/submit-sightings", headers=auth_headers, json={"name": "x"})
+    assert response.status_code == 400
+
+
+def test_search_sightings(client, auth_headers):
+    batch = [
+        {"name": "Angry goose at the bridge", "notes": "hissing loudly", "coords": "43.46,-80.52", "image": ""},
+        {"name": "Calm duck", "notes": "no geese here", "coords": "43.46,-80.52", "image": ""},
+        {"name": "Pond visitor", "notes": "one angry goose, very angry", "coords": "43.46,-80.52", "image": ""},
+    ]
+    client.post("/api/submit-sightings", headers=auth_headers, json=batch)
+
+    response = client.get("/api/sightings/search?q=angry goose")
+    assert response.status_code == 200
+    names = [s["name"] for s in response.json["sightings"]]
+    assert sorted(names) == ["Angry goose at the bridge", "Pond visitor"]
+
+    first = client.get("/api/sightings/search?q=goose&limit=1")
+    assert len(first.json["sightings"]) == 1
+    cursor = first.json["next_cursor"]
+    second = client.get(f"/api/sightings/search?q=goose&limit=1&cursor={cursor}")
+    assert second.json["sightings"][0]["id"] != first.json["sightings"][0]["id"]
+
+
+def test_search_sightings_requires_query(client):
+    response = client.get("/api/sightings/search?q=")
+    assert response.status_code == 400
+
+
+def test_search_sightings_ignores_fts_syntax(client):
+    response = client.get('/api/sightings/search?q=goose" OR (')
+    assert response.status_code == 200
+
+
+def test_search_sightings_without_words(client):
+    response = client.get("/api/sightings/search?q=!!!")
+    assert response.status_code == 200
+    assert response.json["sightings"] == []
+    assert response.json["next_cursor"] is None
+
+
+def test_nearby_sightings(client, auth_headers):
+    batch = [
+        {"name": "waterloo park", "notes": "", "coords": "43.4647,-80.5281", "image": ""},
+        {"name": "uptown", "notes": "", "coords": "43.4649,-80.5225", "image": ""},
+        {"name": "victoria park", "notes": "", "coords": "43.4486,-80.4940", "image": ""},
+    ]
+    client.post("/api/submit-sightings", headers=auth_headers, json=batch)
+
+    response = client.get("/api/sightings/nearby?lat=43.4646&lng=-80.5270&k=2&radius_m=5000")
+    assert response.status_code == 200
+    sightings = response.json["sightings"]
+    assert [s["name"] for s in sightings] == ["waterloo park", "uptown"]
+    assert sightings[0]["distance_m"] < sightings[1]["distance_m"]
+
+    response = client.get("/api/sightings/nearby?lat=43.4646&lng=-80.5270&radius_m=100")
+    assert [s["name"] for s in response.json["sightings"]] == ["waterloo park"]
+
+
+def test_nearby_sightings_single_query(client, count_queries):
+    from app import db
+    from app.models.sightings import Sighting
+
+    # A sighting without a user is not listed, like everywhere else
+    db.session.add(Sighting(name="orphan goose", notes="", coords="34.0522,-118.2437", image=""))
+    db.session.commit()
+
+    count_queries.clear()
+    response = client.get("/api/sightings/nearby?lat=34.0522&lng=-118.2437&radius_m=100")
+    assert response.status_code == 200
+    assert [s["name"] for s in response.json["sightings"]] == ["Test Goose Location"]
+    assert len(count_queries) == 1
+
+
+def test_nearby_sightings_invalid(client):
+    assert client.get("/api/sightings/nearby?lat=43").status_code == 400
+    assert client.get("/api/sightings/nearby?lat=43&lng=-80&k=0").status_code == 400
+
+
+def test_radius_bbox_wraps_antimeridian():
+    from app.main.geo import radius_bbox
+
+    bbox = radius_bbox(0, 179.99, 5000)
+    assert bbox.min_lng > bbox.max_lng
+
+
+def test_sightings_heatmap(client, auth_headers):
+    batch = [
+        {"name": "south west", "notes": "", "coords": "43.1,-80.9", "image": ""},
+        {"name": "south west again", "notes": "", "coords": "43.2,-80.8", "image": ""},
+        {"name": "north east", "notes": "", "coords": "43.9,-80.1", "image": ""},
+    ]
+    client.post("/api/submit-sightings", headers=auth_headers, json=batch)
+
+    response = client.get("/api/sightings/heatmap?bbox=43,-81,44,-80&resolution=2")
+    assert response.status_code == 200
+    assert response.json["grid"] == [[2, 0], [0, 1]]
+    assert response.json["max"] == 2
+
+    response = client.get(
+        "/api/sightings/heatmap?bbox=43,-81,44,-80&resolution=2&half_life_days=7"
+    )
+    assert response.status_code == 200
+    assert 0 < response.json["grid"][1][1] <= 1
+
+
+def test_sightings_heatmap_invalid(client):
+    assert client.get("/api/sightings/heatmap").status_code == 400
+    assert client.get("/api/sightings/heatmap?bbox=43,-81,44,-80&resolution=0").status_code == 400
+
+
+def test_get_sightings_database_json_mode_falls_back_on_sqlite(client):
+    expected = client.get("/api/sightings?limit=10").json
+
+    client.application.config["SIGHTINGS_JSON_MODE"] = "database"
+    client.application.extensions["response_cache"] = None
+    response = client.get("/api/sightings?limit=10")
+    assert response.status_code == 200
+    assert response.json == expected
+
+
+def test_submit_sighting_does_not_reload_after_commit(client, auth_headers, count_queries):
+    data = {"name": "goose", "notes": "", "coords": "43.46,-80.52", "image": ""}
+    count_queries.clear()
+    response = client.post("/api/submit-sighting", headers=auth_headers, json=data)
+    assert response.status_code == 201
+    assert response.json["sighting"]["user"]["id"]
+    selects = [q for q in count_queries if q.lstrip().upper().startswith("SELECT")]
+    # Only the submitting user is read; the response reuses the written row
+    assert len(selects) == 1
+
+
+def test_get_sightings_query_count(client, count_queries):
+    count_queries.clear()
+    response = client.get("/api/sightings")
+    assert response.status_code == 200
+    # The collection version and the listing rows
+    assert len(count_queries) == 2
+
+    count_queries.clear()
+    client.get("/api/sightings")
+    # Served from the cache, version included
+    assert len(count_queries) == 0
@@ -0,0 +1,58 @@
+import datetime
+
+import pytest
+
+
+def submit_batch(client, auth_headers, count):
+    batch = [
+        {"name": f"goose {i}", "notes": "", "coords": "43.46,-80.52", "image": ""}
+        for i in range(count)
+    ]
+    response = client.post("/api/submit-sightings", headers=auth_headers, json=batch)
+    assert response.status_code == 201
+    return [result["sighting"]["id"] for result in response.json["results"]]
+
+
+def total(series):
+    return sum(bucket["count"] for bucket in series)
+
+
+def test_activity_counts_from_rollups(client, auth_headers, count_queries):
+    submit_batch(client, auth_headers, 3)
+    data = {"name": "single goose", "notes": "", "coords": "43.46,-80.52", "image": ""}
+    client.post("/api/submit-sighting", headers=auth_headers, json=data)
+
+    count_queries.clear()
+    response = client.get("/api/stats/activity?bucket=day")
+    assert response.status_code == 200
+    assert len(response.json["series"]) in (30, 31)
+    # The fixture's sighting is inserted directly, so only API writes are counted
+    assert total(response.json["series"]) == 4
+    assert not any("FROM sightings" in query for query in count_queries)
+
+    now = datetime.datetime.utcnow()
+    start = (now - datetime.timedelta(hours=2)).isoformat()
+    end = (now + datetime.timedelta(hours=1)).isoformat()
+    response = client.get(f"/api/stats/activity?bucket=hour&from={start}&to={end}")
+    assert total(response.json["series"]) == 4
+
+    response = client.get("/api/stats/activity?bucket=week")
+    assert total(response.json["series"]) == 4
+
+
+def test_activity_decrements_on_delete(client, auth_headers):
+    sighting_ids = submit_batch(client, auth_headers, 2)
+    client.delete(f"/api/sightings/{sighting_ids[0]}", headers=auth_headers)
+
+    response = client.get("/api/stats/activity?bucket=day")
+    assert total(response.json["series"]) == 1
+
+
+def test_activity_invalid_query(client):
+    assert client.get("/api/stats/activity?bucket=year").status_code == 400
+    assert client.get("/api/stats/activity?from=nope").status_code == 400
+    assert client.get("/api/stats/activity?cell=12").status_code == 400
+    response = client.get(
+        "/api/stats/activity?bucket=hour&from=2000-01-01T00:00:00&to=2020-01-01T00:00:00"
+    )
+    assert response.status_code == 400
@@ -0,0 +1,128 @@
+import json
+import queue
+
+import pytest
+
+from app.pubsub.brokers import LocalBroker, RedisBroker
+
+
+DISCONNECT = object()
+
+
+class FakeRedisPubSub:
+    """Local stand-in for a redis-py PubSub subscribed to one pattern."""
+
+    def __init__(self, server):
+        self.server = server
+        self.messages = queue.Queue()
+
+    def psubscribe(self, pattern):
+        self.pattern = pattern
+        self.server.subscribers.append(self)
+
+    def listen(self):
+        while True:
+            message = self.messages.get()
+            if message is DISCONNECT:
+                self.server.subscribers.remove(self)
+                raise ConnectionError("Connection closed by server.")
+            yield message
+
+
+class FakeRedis:
+    """Local stand-in for the redis-py publish/pubsub commands, shared by workers."""
+
+    def __init__(self):
+        self.subscribers = []
+
+    def publish(self, channel, message):
+        for subscriber in self.subscribers:
+            if channel.startswith(subscriber.pattern.rstrip("*")):
+                subscriber.messages.put(
+                    {"type": "pmessage", "channel": channel.encode(), "data": message.encode()}
+                )
+
+    def pubsub(self):
+        return FakeRedisPubSub(self)
+
+    def disconnect_subscribers(self):
+        for subscriber in list(self.subscribers):
+            subscriber.messages.put(DISCONNECT)
+
+
+def test_local_broker_fan_out():
+    broker = LocalBroker()
+    first = broker.subscribe("sightings")
+    second = broker.subscribe("sightings")
+    broker.publish("sightings", "honk")
+    assert first.get(timeout=1) == "honk"
+    assert second.get(timeout=1) == "honk"
+
+    second.close()
+    broker.publish("sightings", "again")
+    assert first.get(timeout=1) == "again"
+    assert second.get(timeout=0) is None
+
+
+def test_redis_broker_fans_out_across_workers():
+    server = FakeRedis()
+    worker_a = RedisBroker(server)
+    worker_b = RedisBroker(server)
+    subscription = worker_b.subscribe("sightings")
+
+    worker_a.publish("sightings", "honk")
+    assert subscription.get(timeout=1) == "honk"
+
+
+def test_redis_broker_reconnects_after_disconnect():
+    server = FakeRedis()
+    broker = RedisBroker(server, retry_delay=0)
+    subscription = broker.subscribe("sightings")
+
+    server.disconnect_subscribers()
+    # Publish until the listener has resubscribed; earlier messages are lost
+    for _ in range(100):
+        broker.publish("sightings", "honk")
+        if subscription.get(timeout=0.05) == "honk":
+            break
+    else:
+        pytest.fail("listener did not reconnect")
+
+
+def read_event(events):
+    """Return the next non-keepalive chunk from a streamed response."""
+    while True:
+        chunk = next(events)
+        chunk = chunk.decode() if isinstance(chunk, bytes) else chunk
+        if not chunk.startswith(":"):
+            return chunk
+
+
+def submit(client, auth_headers, name, coords):
+    data = {"name": name, "notes": "", "coords": coords, "image": ""}
+    response = client.post("/api/submit-sighting", headers=auth_headers, json=data)
+    assert response.status_code == 201
+
+
+def test_stream_pushes_submitted_sightings(client, auth_headers):
+    client.application.config["SSE_KEEPALIVE_SECONDS"] = 1
+    response = client.get("/api/sightings/stream?bbox=43,-81,44,-80", buffered=False)
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+
+    events = iter(response.response)
+    assert read_event(events).startswith("retry:")
+
+    submit(client, auth_headers, "far goose", "10.5,10.5")
+    submit(client, auth_headers, "kw goose", "43.4647,-80.5281")
+
+    event = read_event(events)
+    assert "event: sighting" in event
+    data = json.loads(event.split("data: ", 1)[1])
+    assert data["name"] == "kw goose"
+    response.close()
+
+
+def test_stream_invalid_bbox(client):
+    response = client.get("/api/sightings/stream?bbox=nope")
+    assert response.status_code == 400
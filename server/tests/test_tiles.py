@@ -0,0 +1,40 @@
+import pytest
+
+from app.tiles.quadkey import latlng_to_tile, tile_to_quadkey
+
+
+def test_tile_to_quadkey():
+    assert tile_to_quadkey(3, 5, 3) == "213"
+    assert tile_to_quadkey(0, 0, 0) == ""
+
+
+def test_get_tile(client, auth_headers):
+    data = {"name": "tile goose", "notes": "", "coords": "43.4647,-80.5281", "image": ""}
+    client.post("/api/submit-sighting", headers=auth_headers, json=data)
+
+    x, y = latlng_to_tile(43.4647, -80.5281, 12)
+    response = client.get(f"/api/tiles/12/{x}/{y}")
+    assert response.status_code == 200
+    assert [s["name"] for s in response.json["sightings"]] == ["tile goose"]
+    assert "public" in response.headers["Cache-Control"]
+
+    etag = response.headers["ETag"]
+    response = client.get(f"/api/tiles/12/{x}/{y}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_get_tile_changes_after_write(client, auth_headers):
+    x, y = latlng_to_tile(43.4647, -80.5281, 12)
+    etag = client.get(f"/api/tiles/12/{x}/{y}").headers["ETag"]
+
+    data = {"name": "new goose", "notes": "", "coords": "43.4647,-80.5281", "image": ""}
+    client.post("/api/submit-sighting", headers=auth_headers, json=data)
+
+    response = client.get(f"/api/tiles/12/{x}/{y}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_get_tile_invalid(client):
+    assert client.get("/api/tiles/2/0/0").status_code == 400
+    assert client.get("/api/tiles/12/5000/0").status_code == 400
@@ -90,3 +90,122 @@ def test_update_profile_invalid_json(client, auth_headers):
     response = client.post("/api/update-profile", headers=headers, data="{invalid json")
     assert response.status_code == 400
     assert "Invalid JSON format" in response.json["error"]
+
+
+def _test_user_id():
+    from app.models.user import User
+
+    return str(User.query.filter_by(email="test@test.com").first().id)
+
+
+def _submit_sighting(client, auth_headers, name):
+    data = {
+        "name": name,
+        "notes": "i am a note",
+        "coords": "34.0522,-118.2437",
+        "image": "https://my-bucket-name.s3.amazonaws.com/folder1/image.jpg",
+    }
+    response = client.post("/api/submit-sighting", headers=auth_headers, json=data)
+    assert response.status_code == 201
+    return response.json["sighting"]["id"]
+
+
+def test_user_summary_counters(client, auth_headers):
+    """Test the sighting counters track submissions and deletions"""
+    user_id = _test_user_id()
+    before = client.get(f"/api/user/{user_id}/summary", headers=auth_headers).json
+    start = before["user"]["sightings_count"]
+
+    first_id = _submit_sighting(client, auth_headers, "first goose")
+    _submit_sighting(client, auth_headers, "second goose")
+    batch = [
+        {"name": f"batch goose {i}", "notes": "", "coords": "34.0522,-118.2437", "image": ""}
+        for i in range(2)
+    ]
+    response = client.post("/api/submit-sightings", headers=auth_headers, json=batch)
+    assert response.status_code == 201
+
+    response = client.delete(f"/api/sightings/{first_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    response = client.get(f"/api/user/{user_id}/summary", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json["user"]["sightings_count"] == start + 3
+    assert response.json["user"]["last_sighting_at"] is not None
+
+
+def test_last_sighting_at_never_moves_back(client, auth_headers):
+    """Test an insert committing after a newer one keeps the newer time"""
+    import datetime
+
+    from app import db
+    from app.models.user import User
+
+    user_id = _test_user_id()
+    later = datetime.datetime(2100, 1, 1)
+    User.adjust_sightings_count(uuid.UUID(user_id), 1, later)
+    User.adjust_sightings_count(uuid.UUID(user_id), 1, datetime.datetime(2000, 1, 1))
+    db.session.commit()
+
+    response = client.get(f"/api/user/{user_id}/summary", headers=auth_headers)
+    assert response.json["user"]["last_sighting_at"].startswith("2100-01-01")
+
+
+def test_user_summary_first_page(client, auth_headers):
+    """Test the summary embeds the newest page of the user's sightings"""
+    user_id = _test_user_id()
+    for i in range(3):
+        _submit_sighting(client, auth_headers, f"goose {i}")
+
+    response = client.get(f"/api/user/{user_id}/summary?limit=2", headers=auth_headers)
+    assert response.status_code == 200
+    sightings = response.json["sightings"]
+    assert [s["name"] for s in sightings] == ["goose 2", "goose 1"]
+    assert all(s["user"]["id"] == user_id for s in sightings)
+    assert response.json["next_cursor"]
+
+    response = client.get(
+        f"/api/sightings?user_id={user_id}&limit=2"
+        f"&cursor={response.json['next_cursor']}"
+    )
+    assert [s["name"] for s in response.json["sightings"]][0] == "goose 0"
+
+
+def test_user_summary_single_query(client, auth_headers, count_queries):
+    """Test the profile and sightings page are fetched in one statement"""
+    user_id = _test_user_id()
+    count_queries.clear()
+    response = client.get(f"/api/user/{user_id}/summary", headers=auth_headers)
+    assert response.status_code == 200
+    # One lookup of the requesting user and one for the summary itself
+    assert len(count_queries) == 2
+
+
+def test_user_summary_not_found(client, auth_headers):
+    """Test the summary of an unknown user"""
+    response = client.get(f"/api/user/{uuid.uuid4()}/summary", headers=auth_headers)
+    assert response.status_code == 404
+    response = client.get("/api/user/not-a-uuid/summary", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_get_user_query_count(client, auth_headers, count_queries):
+    """Test reading your own profile is answered from the requester lookup"""
+    user_id = _test_user_id()
+    count_queries.clear()
+    response = client.get(f"/api/user/{user_id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json["user"]["id"] == user_id
+    assert len(count_queries) == 1
+
+
+def test_update_profile_does_not_reload_after_commit(client, auth_headers, count_queries):
+    """Test the profile response is built without re-reading the user"""
+    count_queries.clear()
+    response = client.post(
+        "/api/update-profile", headers=auth_headers, json={"description": "honk"}
+    )
+    assert response.status_code == 200
+    assert response.json["user"]["description"] == "honk"
+    selects = [q for q in count_queries if q.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1